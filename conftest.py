@@ -0,0 +1,8 @@
+"""
+Pytest configuration shared by the test scripts
+"""
+
+import os
+
+# Keep web search results from test runs out of any persistent cache configured in .env
+os.environ["SEARCH_CACHE_PATH"] = ""
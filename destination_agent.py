@@ -2,21 +2,40 @@
 Destination Research Agent for handling specific and abstract destination requests
 """
 
+import functools
+import hashlib
+import heapq
+import logging
 import os
+import orjson
+import queue
 import requests
-from typing import Dict, List, Optional, Union, Tuple, Any, Callable
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Dict, List, Optional, Union, Tuple, Any, Callable, Iterable, Iterator
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage
-from pydantic import BaseModel
+from langchain_core.caches import InMemoryCache
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+from langchain_core.tools import tool
+from pydantic import BaseModel, ConfigDict, ValidationError
 from datetime import datetime, timedelta
 import re
-from preferences_manager import PreferencesManager
-from feasibility_checker import FeasibilityChecker
+from preferences_manager import get_preferences_manager
+from feasibility_checker import get_feasibility_checker
+from search_cache import search_cache
 
 # Load environment variables
 load_dotenv()
 
+# Per-item tracing (queries, per-destination checks, parameter dumps) goes to DEBUG; progress stays on stdout
+logger = logging.getLogger(__name__)
+
 class DestinationRequest(BaseModel):
     """Structure for destination research requests"""
     query: str
@@ -34,6 +53,9 @@ class DestinationRequest(BaseModel):
 
 class DestinationOption(BaseModel):
     """Structure for destination options"""
+    # Immutable once built; use model_copy(update=...) to derive an updated option
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     name: str
     country: str
     region: str
@@ -61,6 +83,24 @@ class DestinationOption(BaseModel):
     image_urls: List[str] = []  # Additional images
     business_friendly: Optional[bool] = None
 
+class SpecificDestinationResearch(BaseModel):
+    """Structured output for single-destination research in one LLM call"""
+    travel_recommendations: str  # Full written destination profile shown to the user
+    destination: DestinationOption
+
+class MultiDestinationResearch(BaseModel):
+    """Structured output for multi-destination research in one LLM call"""
+    travel_recommendations: str  # Full written recommendations/comparison shown to the user
+    destinations: List[DestinationOption]
+
+class ExtractedDestinations(BaseModel):
+    """Structured output for pulling every destination out of research text"""
+    destinations: List[DestinationOption]
+
+class ExtractedDestinationNames(BaseModel):
+    """Structured output for naming the destination in each of a numbered list of search results"""
+    names: List[Optional[str]]  # One entry per result, in order; null when a result names no destination
+
 class DestinationResearchResult(BaseModel):
     """Structure for destination research results"""
     request_type: str  # "specific", "abstract", "multi_location"
@@ -74,6 +114,624 @@ class DestinationResearchResult(BaseModel):
     budget_required: bool = False
     origin_required: bool = False
 
+# Exact-match cache of LLM responses shared by all agents in the process: a prompt that repeats
+# verbatim (same request text, same cached web results, same model settings) skips the OpenAI call
+llm_response_cache = InMemoryCache(maxsize=512)
+
+# Computed once at import so prompts track the current year without varying between calls
+CURRENT_YEAR = datetime.now().year
+
+# Static instructions are kept in system messages ahead of the per-request content so the
+# prompt prefix is identical across calls and can be served from the provider's prompt cache.
+
+REQUEST_TYPE_SYSTEM_PROMPT = """Analyze the travel request and determine the type of destination inquiry.
+
+Classify as one of these types:
+1. "specific" - User mentions a specific destination (e.g., "Paris", "Tokyo", "New York")
+2. "abstract" - User describes desired characteristics (e.g., "sunny beach", "mountain destination", "cultural city")
+3. "multi_location" - User mentions multiple destinations or wants to compare options
+4. "constrained" - User has specific constraints (time, distance, budget) but flexible on destination
+
+Respond with just the type: specific, abstract, multi_location, or constrained"""
+
+PARAMETER_EXTRACTION_SYSTEM_PROMPT = f"""Extract destination research parameters from the travel request.
+
+Fill in these fields:
+{{
+    "query": "The main destination query or description",
+    "origin_location": "Starting location if mentioned (e.g., 'SFO', 'New York', 'London')",
+    "max_travel_time": "Maximum travel time if specified (e.g., '3 hours', '5 hours')",
+    "travel_dates": "Travel dates if mentioned (e.g., 'June {CURRENT_YEAR}', 'summer', 'next month')",
+    "budget": "Budget constraints if mentioned (e.g., '$2000', 'budget-friendly', 'luxury')",
+    "interests": ["List of interests mentioned (e.g., 'beaches', 'history', 'food')"],
+    "travel_style": "Travel style if mentioned (e.g., 'relaxing', 'adventure', 'cultural')",
+    "traveler_type": "Type of travelers if mentioned (e.g., 'family_with_kids', 'couple', 'solo', 'older_adults', 'group_friends', 'business')",
+    "group_size": "Number of people traveling if mentioned (e.g., 2, 4, 6)",
+    "age_range": "Age range if mentioned (e.g., 'young_adults', 'middle_aged', 'seniors', 'mixed_ages')",
+    "mobility_requirements": "Mobility needs if mentioned (e.g., 'wheelchair_accessible', 'limited_mobility', 'active', 'any')",
+    "seasonal_preferences": "Season preference if mentioned (e.g., 'summer', 'winter', 'spring', 'fall', 'any')"
+}}
+
+If a field is not mentioned, use null. Be specific and accurate."""
+
+SPECIFIC_RESEARCH_SYSTEM_PROMPT = f"""Research the requested destination.
+
+Use your knowledge and the current web information provided with the request to give comprehensive details about this destination.
+If a web_search tool is available, only search for details that need to be current (entry requirements, advisories, seasonal events).
+
+Provide detailed information about:
+- Best time to visit (consider current year {CURRENT_YEAR})
+- Key attractions and activities
+- Climate and weather patterns
+- Visa requirements and entry procedures
+- Language and currency
+- Safety considerations and travel advisories
+- Estimated costs for different budget levels
+- Local transportation options
+- Cultural highlights and experiences
+- Why it's recommended for travel
+
+If an origin location is provided, include travel time and transportation options.
+If a budget is specified, tailor recommendations accordingly.
+If interests are mentioned, focus on relevant attractions and activities.
+
+Provide a comprehensive, up-to-date destination profile based on your knowledge and current information.
+
+When returning structured output, put the full written profile in travel_recommendations and the same
+information in the structured destination (use the requested destination as the name, keep the description under 200 characters)."""
+
+ABSTRACT_RESEARCH_SYSTEM_PROMPT = f"""Find destinations that match the criteria in the request.
+
+IMPORTANT CONSTRAINTS:
+- If a maximum travel time is specified, ONLY recommend destinations that are actually within that travel time from the origin
+- For example, if origin is SFO and max travel time is 3 hours, destinations like Greece, Europe, or Asia are NOT acceptable
+- Only recommend destinations that are realistically reachable within the specified time constraint
+- If no destinations meet the time constraint, say so clearly
+
+TRAVELER-SPECIFIC CONSIDERATIONS:
+- Consider the traveler type when ranking destinations
+- For families with kids: prioritize family-friendly activities, safety, and kid-appropriate attractions
+- For couples: consider romantic appeal, adult-oriented activities, and intimate settings
+- For solo travelers: focus on safety, social opportunities, and solo-friendly activities
+- For older adults: consider accessibility, comfort, and less physically demanding activities
+- For groups of friends: look for social activities, nightlife, and group-friendly accommodations
+- For business travelers: prioritize convenience, business facilities, and professional amenities
+
+PREFERENCES-BASED CONSIDERATIONS:
+- Hotel preferences: Consider preferred hotel chains and loyalty programs
+- Flight preferences: Consider airline alliances, class preferences, and red-eye preferences
+- Budget preferences: Align recommendations with budget level and spending patterns
+- Activity preferences: Match outdoor/indoor activities and adventure level
+- Cultural preferences: Consider cultural sensitivity and authentic experiences
+- Safety preferences: Prioritize safety-conscious recommendations
+- Technology preferences: Consider digital-friendly destinations and connectivity
+- Environmental preferences: Factor in eco-conscious and sustainable options
+
+SEASONAL CONSIDERATIONS:
+- Consider the time of year (seasonal preferences or travel dates) when ranking destinations
+- Factor in weather conditions, crowd levels, and seasonal activities
+- Adjust recommendations based on peak/off-peak seasons
+- Consider seasonal pricing and availability
+
+EVALUATION INSTRUCTIONS:
+1. Review the web search results in the request, which are already ordered by relevance to the criteria
+2. Evaluate each destination in the order presented, considering how well it matches the specific criteria
+3. Focus on destinations that appear early in the ordered list as they scored highest for relevance
+4. Use both the web search information and your knowledge to provide comprehensive recommendations
+
+Use your knowledge and current information to provide 3-5 destination recommendations that match ALL criteria.
+For each destination, include:
+- Name and location
+- Why it matches the criteria (especially for the specific traveler type)
+- Best time to visit (consider current year {CURRENT_YEAR} and seasonal factors)
+- Key attractions and activities (tailored to traveler type)
+- EXACT travel time from origin (if specified) - be accurate
+- Estimated costs for different budget levels
+- Climate and weather (consider seasonal variations)
+- Safety considerations (especially important for families and solo travelers)
+- Family-friendliness score (1-10) if applicable
+- Accessibility features if mobility requirements are specified
+- Seasonal highlights and crowd levels
+- Unique selling points for the specific traveler type
+
+Rank them by how well they match the criteria, considering both the basic requirements AND the traveler demographics and seasonal factors.
+
+When returning structured output, put the full written recommendations in travel_recommendations and one
+structured entry per recommended destination in destinations, in ranked order (keep each description under 150 characters)."""
+
+MULTI_LOCATION_SYSTEM_PROMPT = f"""Analyze the multi-location travel request.
+
+If multiple specific destinations are mentioned, provide detailed comparison using the current web information provided with the request.
+If a web_search tool is available, only search for details that need to be current (entry requirements, advisories, seasonal events).
+If the user wants to choose between options, provide pros/cons for each.
+
+For each destination, include:
+- Overview and highlights
+- Best time to visit (consider current year {CURRENT_YEAR})
+- Key attractions and activities
+- Travel logistics (if origin specified)
+- Costs and budget considerations
+- Safety and current travel conditions
+- Unique selling points
+- Current travel requirements and advisories
+
+Provide a comprehensive comparison summary highlighting differences, current conditions, and recommendations.
+
+When returning structured output, put the full written comparison in travel_recommendations and one
+structured entry per destination compared in destinations (keep each description under 150 characters)."""
+
+CONSTRAINED_RESEARCH_SYSTEM_PROMPT = """Find destinations that meet the specific constraints in the request.
+
+EVALUATION INSTRUCTIONS:
+1. Review the web search results in the request, which are already ordered by relevance to the constraints
+2. Evaluate each destination in the order presented, focusing on constraint compliance
+3. Prioritize destinations that appear early in the ordered list as they scored highest for constraint relevance
+4. Use both the web search information and your knowledge to provide comprehensive recommendations
+
+Focus on destinations that are:
+1. Within the specified travel time from origin
+2. Match the budget constraints
+3. Align with interests and travel style
+4. Currently accessible and safe to visit
+
+Use your knowledge and current information to provide 3-5 options ranked by how well they meet the constraints.
+Include:
+- Exact travel time from origin
+- Current costs and budget considerations
+- Why each destination fits the criteria
+- Current travel conditions and requirements
+- Best time to visit considering constraints
+
+When returning structured output, put the full written recommendations in travel_recommendations and one
+structured entry per recommended destination in destinations, in ranked order (keep each description under 150 characters)."""
+
+DESTINATION_EXTRACTION_SYSTEM_PROMPT = """Extract structured information from the destination research response.
+
+Fill in these fields:
+{
+    "name": "The destination name given with the response",
+    "country": "Country name",
+    "region": "Region/state/province",
+    "description": "Brief description (max 200 chars)",
+    "best_time_to_visit": "Best time to visit",
+    "key_attractions": ["List of top 3-5 attractions"],
+    "activities": ["List of top 3-5 activities"],
+    "climate": "Climate description",
+    "visa_requirements": "Visa requirements",
+    "language": "Primary language",
+    "currency": "Local currency",
+    "safety_rating": "Safety rating/considerations",
+    "why_recommended": "Why this destination is recommended"
+}
+
+Base the information on the response content. If information is not available, use reasonable defaults."""
+
+MULTI_DESTINATION_EXTRACTION_SYSTEM_PROMPT = """Extract multiple destinations from the research response.
+
+Call ExtractedDestinations with one entry per destination mentioned in the response, in the order they appear.
+- Keep each description under 150 characters and list the top 3 attractions and activities
+- family_friendly_score is 1-10, or null if not applicable
+- crowd_levels is low/moderate/high/peak, nightlife_rating is none/limited/moderate/vibrant and romantic_appeal is low/moderate/high
+- seasonal_highlights maps summer, winter, spring and fall to that season's highlights
+
+If information is not available for a field, use reasonable defaults."""
+
+DESTINATION_NAME_SYSTEM_PROMPT = """Extract the main destination name from the web search result.
+
+Return only the destination name (e.g., "Paris", "Tokyo", "Barcelona").
+If no clear destination is mentioned, return "None"."""
+
+DESTINATION_NAMES_SYSTEM_PROMPT = """Extract the main destination name from each numbered web search result.
+
+Return one name per result, in the same order (e.g., "Paris", "Tokyo", "Barcelona").
+Use null for a result that doesn't mention a clear destination."""
+
+IMAGE_SEARCH_TERMS_SYSTEM_PROMPT = """Suggest image search terms for the destination.
+
+Return a JSON object with search terms that would help find good travel photos:
+{
+    "search_terms": ["term1", "term2", "term3"],
+    "description": "Brief description of what images to look for"
+}
+
+Focus on:
+- Famous landmarks or attractions
+- Beautiful scenery or landscapes
+- Cultural highlights
+- Popular tourist spots
+
+Return only the JSON, no additional text."""
+
+# Per-request message bodies, filled in with str.format so only the request fields change between calls
+
+NO_WEB_INFORMATION = "No current web information available - rely on your knowledge"
+
+WEB_INFORMATION_TEMPLATE = """{request_details}
+
+Current Web Information:
+{current_info}"""
+
+SPECIFIC_RESEARCH_REQUEST_TEMPLATE = """Research the destination: {query}
+Origin location: {origin_location}
+Budget: {budget}
+Interests: {interests}"""
+
+ABSTRACT_RESEARCH_REQUEST_TEMPLATE = """Query: {query}
+Origin: {origin_location}
+Max travel time: {max_travel_time}
+Budget: {budget}
+Interests: {interests}
+Travel style: {travel_style}
+Traveler type: {traveler_type}
+Group size: {group_size}
+Age range: {age_range}
+Mobility requirements: {mobility_requirements}
+Seasonal preferences: {seasonal_preferences}
+Travel dates: {travel_dates}
+
+WEB SEARCH RESULTS (ordered by relevance to criteria):
+{web_context}
+
+Current Travel Information:
+{current_info}"""
+
+MULTI_LOCATION_REQUEST_TEMPLATE = "Multi-location travel request: {query}"
+
+DESTINATION_EXTRACTION_REQUEST_TEMPLATE = """Destination: {destination_name}
+Response: {response}"""
+
+MULTI_DESTINATION_EXTRACTION_REQUEST_TEMPLATE = "Response: {response}"
+
+CONSTRAINED_RESEARCH_REQUEST_TEMPLATE = """Origin: {origin_location}
+Max travel time: {max_travel_time}
+Budget: {budget}
+Interests: {interests}
+Travel style: {travel_style}
+
+WEB SEARCH RESULTS (ordered by relevance to constraints):
+{web_context}
+
+Current Travel Information:
+{current_info}"""
+
+# Upper bound on the web searches the research LLM may request in one tool-calling round
+MAX_RESEARCH_SEARCHES = 4
+
+# Finished research is reused for identical requests (same type, parameters and preferences) for an hour
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 60 * 60
+
+# Keyword groups _calculate_criterion_score looks for in lowercased search results (substring matches),
+# each compiled into one alternation so a group is a single scan
+CRITERION_KEYWORD_PATTERNS = {
+    name: re.compile('|'.join(map(re.escape, keywords)))
+    for name, keywords in {
+        "budget": ("budget", "cheap", "affordable"),
+        "luxury": ("luxury", "expensive", "premium"),
+        "price": ("$", "cost", "price"),
+        "family": ("family", "kids", "children"),
+        "solo": ("solo", "single", "backpacker"),
+        "summer": ("summer", "warm"),
+        "winter": ("winter", "snow", "cold"),
+        "travel_time": ("hour", "flight", "distance"),
+        "accessibility": ("accessible", "wheelchair", "mobility"),
+    }.items()
+}
+
+# LLM-extracted destination names per search result; results are cached for a day, so the same ones recur
+DESTINATION_NAME_CACHE_SIZE = 4096
+
+# (connect, read) timeouts for SerpAPI requests so a stalled connection can't hang research
+SERPAPI_TIMEOUT = (3, 10)
+
+# Labels analyze_request_type can return; the LLM answer is a single one of these
+REQUEST_TYPES = ("specific", "abstract", "multi_location", "constrained")
+# Spaces and hyphens in a classifier answer, so "Multi-location" reads as "multi_location"
+REQUEST_TYPE_SEPARATOR_PATTERN = re.compile(r'[\s-]+')
+
+# Cheap request-type checks tried in order before asking the LLM; anything ambiguous falls through.
+# Single named places are left to the known-destination check, which also sees any second place.
+QUICK_REQUEST_CLASSIFIERS = [
+    (re.compile(r'\b(?:within|under|less than)\s+\d+(?:\.\d+)?\s*(?:hours?|hrs?)\b', re.IGNORECASE), "constrained"),  # "within 3 hours of SFO"
+    (re.compile(r'\b(?:vs\.?|versus|compare|comparing|comparison)\b', re.IGNORECASE), "multi_location"),  # "Tokyo vs Seoul"
+    (re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+or\s+[A-Z][a-z]+'), "multi_location"),  # "Tokyo or Seoul"
+    (re.compile(r'\b\d+(?:\.\d+)?[\s-]*(?:hours?|hrs?)\s+(?:drive|flight|away)\b', re.IGNORECASE), "constrained"),  # "3 hour drive from Denver"
+]
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip accents so "Zürich" and "zurich" compare equal"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+def normalize_search_query(query: str) -> str:
+    """Collapse whitespace; case is kept, since Google's OR/AND operators only work in uppercase"""
+    return " ".join(query.split())
+
+# Search operators that change the results, so they keep their case in cache keys
+SEARCH_OPERATORS = frozenset({"OR", "AND"})
+
+def search_cache_key(query: str) -> str:
+    """Cache key for a search: casefolded words with operators ("OR", "site:...") left as they are"""
+    return " ".join(
+        token if token in SEARCH_OPERATORS or ":" in token else token.casefold()
+        for token in query.split()
+    )
+
+# Well-known destinations for classifying short requests like "Paris" or "Tokyo and Kyoto" without an LLM call
+KNOWN_DESTINATIONS = (
+    'Amsterdam', 'Athens', 'Bali', 'Bangkok', 'Barcelona', 'Beijing', 'Berlin', 'Boston', 'Budapest',
+    'Buenos Aires', 'Cairo', 'Cancun', 'Cape Town', 'Chicago', 'Copenhagen', 'Dubai', 'Dublin',
+    'Edinburgh', 'Florence', 'Hanoi', 'Havana', 'Hong Kong', 'Honolulu', 'Istanbul', 'Kyoto', 'Las Vegas',
+    'Lisbon', 'London', 'Los Angeles', 'Madrid', 'Marrakech', 'Melbourne', 'Mexico City', 'Miami',
+    'Montreal', 'Munich', 'Nashville', 'New Orleans', 'New York', 'Osaka', 'Paris', 'Prague', 'Reykjavik',
+    'Rio de Janeiro', 'Rome', 'San Diego', 'San Francisco', 'Santorini', 'Seattle', 'Seoul', 'Singapore',
+    'Stockholm', 'Sydney', 'Taipei', 'Tokyo', 'Toronto', 'Vancouver', 'Venice', 'Vienna', 'Zurich'
+)
+KNOWN_DESTINATION_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(fold_text(name)) for name in sorted(KNOWN_DESTINATIONS, key=len, reverse=True)) + r')\b'
+)
+# Folded spelling -> display name, for turning KNOWN_DESTINATION_PATTERN matches back into names
+KNOWN_DESTINATION_NAMES = {fold_text(name): name for name in KNOWN_DESTINATIONS}
+# "to" or an arrow right after a place, as in "New York to Paris", marking that place as the origin
+ROUTE_SEPARATOR_PATTERN = re.compile(r'\s*(?:to\b|->|→)')
+# Words that make a request about characteristics or options rather than the named places themselves
+DESTINATION_DESCRIPTOR_PATTERN = re.compile(
+    r'\b(?:near|around|close to|outside|like|similar|beach(?:es)?|mountains?|somewhere|anywhere|places?|'
+    r'destinations?|ideas?|options?|suggest\w*|recommend\w*|cheap\w*|budget|within)\b'
+)
+
+# Most destinations kept from one multi-destination extraction
+MAX_EXTRACTED_DESTINATIONS = 5
+
+def iter_json_array_objects(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the text of each object in a streamed JSON array as soon as the object is complete
+    
+    Text before the array (a markdown fence, or a wrapping {"destinations": ...}) is skipped, and
+    scanning stops when the array closes.
+    """
+    depth = 0  # 0 before the array, 1 between its items, 2+ inside an item
+    in_string = escaped = False
+    current: List[str] = []
+    for chunk in chunks:
+        for char in chunk:
+            if depth == 0:
+                if char == '[':
+                    depth = 1
+                continue
+            if depth >= 2:
+                current.append(char)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '{[':
+                if depth == 1:
+                    current.append(char)
+                depth += 1
+            elif char in '}]':
+                depth -= 1
+                if depth == 1 and current:
+                    yield "".join(current)
+                    current = []
+                elif depth == 0:
+                    return
+
+def parse_llm_json(text: str) -> Any:
+    """Parse the outermost {...} object in an LLM reply that may have a markdown fence or text around it
+    
+    Raises ValueError if the reply has no object or the object isn't valid JSON.
+    """
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end < start:
+        raise ValueError("No JSON object in the LLM reply")
+    return orjson.loads(text[start:end + 1])
+
+# Pulls destination names out of research text in one pass when structured extraction fails. Groups:
+# numbered-list prefix ("1. **Monterey, CA**", "### 1. **Monterey, CA**"), bold text ("**Monterey, CA**")
+# and a "City, ST" line start ("Monterey, CA")
+DESTINATION_NAME_PATTERN = re.compile(
+    r'(\d+\.\s*)?\*\*([^*]+)\*\*|^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})',
+    re.MULTILINE
+)
+
+# The "Title: ..." line of a formatted search result
+SEARCH_RESULT_TITLE_PATTERN = re.compile(r'^Title:\s*(.+)$', re.MULTILINE)
+# A "Monterey, CA" / "Carmel, California" place in a result title, with up to three leading title words
+TITLE_PLACE_PATTERN = re.compile(r"\b((?:[A-Z][\w'’.-]*\s+){0,3}[A-Z][\w'’.-]*),\s*(?:[A-Z]{2}\b|[A-Z][a-z]+)")
+# Title-case words that come before a place name in titles ("Things To Do In Monterey, CA")
+TITLE_STOPWORDS = frozenset({
+    'A', 'An', 'The', 'To', 'Do', 'In', 'Of', 'At', 'On', 'For', 'And', 'From', 'Near', 'Around', 'Your',
+    'Visit', 'Visiting', 'Explore', 'Exploring', 'Best', 'Top', 'Ultimate', 'Complete', 'Things', 'Places',
+    'Guide', 'Travel', 'Trip', 'Trips', 'Tour', 'Tours', 'Vacation', 'Vacations', 'Weekend', 'Getaway',
+    'Getaways', 'Day', 'Days', 'Hotels', 'Itinerary'
+})
+
+# Labels of "Best time to visit: ..." / "- **Currency:** ..." lines in research text, by DestinationOption field
+DESTINATION_FIELD_LABELS = {
+    "country": "country",
+    "region": "region",
+    "state": "region",
+    "best time to visit": "best_time_to_visit",
+    "best time": "best_time_to_visit",
+    "when to visit": "best_time_to_visit",
+    "climate": "climate",
+    "weather": "climate",
+    "visa requirements": "visa_requirements",
+    "visa": "visa_requirements",
+    "entry requirements": "visa_requirements",
+    "language": "language",
+    "languages": "language",
+    "currency": "currency",
+    "safety": "safety_rating",
+    "safety rating": "safety_rating",
+    "safety considerations": "safety_rating",
+    "why visit": "why_recommended",
+    "why it's recommended": "why_recommended",
+    "why recommended": "why_recommended",
+}
+
+# One labeled line, with optional bullet/heading/bold markup around the label (longest labels tried first)
+DESTINATION_FIELD_PATTERN = re.compile(
+    r'^[ \t>#*\-•]*(' + '|'.join(sorted(map(re.escape, DESTINATION_FIELD_LABELS), key=len, reverse=True)) +
+    r')\**\s*:\s*\**\s*(\S.*?)\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# A "Key Attractions" / "Activities" heading followed by its bullet list
+DESTINATION_LIST_PATTERN = re.compile(
+    r'^[ \t#*\-•]*((?:key |top |main )?attractions|activities|things to do)\b[^\n]*\n((?:[ \t]*(?:[-*•]|\d+\.)[ \t]+.+\n?)+)',
+    re.IGNORECASE | re.MULTILINE
+)
+DESTINATION_LIST_ITEM_PATTERN = re.compile(r'^[ \t]*(?:[-*•]|\d+\.)[ \t]+\**([^*:\n]+)', re.MULTILINE)
+
+# Fields the deterministic pre-pass must fill (name and description always count) before the LLM is skipped
+DETERMINISTIC_EXTRACTION_MIN_FIELDS = 8
+
+# Destinations that can't be within a short trip of these origins, matched as whole words
+INVALID_DESTINATIONS_BY_ORIGIN = {
+    'SFO': [
+        'GREECE', 'HYDRA', 'EUROPE', 'FRANCE', 'ITALY', 'SPAIN', 'GERMANY', 'PORTUGAL',
+        'ASIA', 'JAPAN', 'CHINA', 'KOREA', 'THAILAND', 'SINGAPORE', 'VIETNAM', 'INDIA',
+        'AUSTRALIA', 'NEW ZEALAND', 'AFRICA', 'SOUTH AMERICA', 'BRAZIL', 'ARGENTINA',
+        'RUSSIA', 'TURKEY', 'ISRAEL', 'EGYPT', 'MOROCCO', 'SOUTH AFRICA'
+    ],
+    'NYC': [
+        'EUROPE', 'FRANCE', 'ITALY', 'SPAIN', 'GERMANY', 'GREECE', 'PORTUGAL', 'NETHERLANDS',
+        'ASIA', 'JAPAN', 'CHINA', 'KOREA', 'THAILAND', 'SINGAPORE', 'VIETNAM', 'INDIA',
+        'AUSTRALIA', 'NEW ZEALAND', 'AFRICA', 'SOUTH AMERICA', 'BRAZIL', 'ARGENTINA',
+        'RUSSIA', 'TURKEY', 'ISRAEL', 'EGYPT', 'MOROCCO', 'SOUTH AFRICA'
+    ]
+}
+
+INVALID_DESTINATION_PATTERNS = {
+    origin: re.compile(r'\b(' + '|'.join(map(re.escape, names)) + r')\b')
+    for origin, names in INVALID_DESTINATIONS_BY_ORIGIN.items()
+}
+
+# Origin spellings (upper-cased) that share an invalid-destination list
+ORIGIN_ALIASES = {
+    'SFO': 'SFO', 'SAN FRANCISCO': 'SFO', 'CALIFORNIA': 'SFO',
+    'NYC': 'NYC', 'NEW YORK': 'NYC', 'JFK': 'NYC', 'LGA': 'NYC'
+}
+
+# Patterns for the regex fallback in extract_destination_parameters, tried in order (first match wins)
+ORIGIN_PATTERNS = [
+    re.compile(r'from\s+([A-Z]{3})', re.IGNORECASE),  # "from SFO"
+    re.compile(r'from\s+([A-Za-z\s]+)', re.IGNORECASE),  # "from San Francisco"
+    re.compile(r'([A-Z]{3})\s+to', re.IGNORECASE),  # "SFO to"
+    re.compile(r'([A-Za-z\s]+)\s+to', re.IGNORECASE)  # "San Francisco to"
+]
+
+HOURS_UNIT = r'(?:hours?|hrs?|h)'
+
+TRAVEL_TIME_PATTERNS = [
+    re.compile(rf'within\s+(\d+\s*{HOURS_UNIT})\b', re.IGNORECASE),  # "within 3 hours"
+    re.compile(rf'(\d+\s*{HOURS_UNIT})\s+from', re.IGNORECASE),  # "3 hours from"
+    re.compile(rf'(\d+\s*{HOURS_UNIT})\s+flight', re.IGNORECASE),  # "3 hours flight"
+    re.compile(rf'(\d+\s*{HOURS_UNIT})\s+drive', re.IGNORECASE)  # "3 hours drive"
+]
+
+# The first duration in a travel time constraint ("3 hours", "3-hour", "3h", "90 minutes", "2 days"); a bare number is hours
+TRAVEL_DURATION_PATTERN = re.compile(
+    rf'\b(\d+(?:\.\d+)?)\s*-?\s*({HOURS_UNIT}|minutes?|mins?|days?)?\b', re.IGNORECASE
+)
+# Hours per duration unit, by the unit's first letter
+TRAVEL_DURATION_UNIT_HOURS = {'h': 1, 'm': 1 / 60, 'd': 24}
+
+# Seasons in free-text travel dates -> (display name, months)
+DATE_SEASONS = {
+    'spring': ('Spring', (3, 4, 5)),
+    'summer': ('Summer', (6, 7, 8)),
+    'fall': ('Fall', (9, 10, 11)),
+    'autumn': ('Fall', (9, 10, 11)),
+    'winter': ('Winter', (12, 1, 2))
+}
+# Month names and abbreviations in free-text travel dates -> month number
+DATE_MONTHS = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sept': 9, 'sep': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+}
+# A year, season or month in lowercased travel dates, so one scan finds all three ("june", "summer 2026")
+DATE_TERM_PATTERN = re.compile(
+    r'\b(?:(?P<year>20\d{2})|(?P<season>' + '|'.join(DATE_SEASONS) + r')|(?P<month>' +
+    '|'.join(sorted(DATE_MONTHS, key=len, reverse=True)) + r'))\b'
+)
+
+# Summary line shown in the UI once request parameters are extracted
+PARAMETERS_DETAILS_TEMPLATE = (
+    "Query: {query} | Origin: {origin_location} | Budget: {budget} | Dates: {travel_dates} | "
+    "Group Size: {group_size} | Traveler Type: {traveler_type}"
+)
+
+# Lowercased placeholder values the extractor uses for "not given"
+MISSING_BUDGET_VALUES = frozenset({"", "none", "not specified"})
+MISSING_ORIGIN_VALUES = frozenset({"", "none", "not specified", "unknown"})
+
+GROUP_SIZE_PATTERN = re.compile(r'\b(\d+)\s*(people|travelers|guests|adults)\b', re.IGNORECASE)
+
+# Keywords for the remaining fallback fields. Per field, values are in priority order: the first
+# value with any keyword in the request wins, whatever its position in the text
+FALLBACK_FIELD_KEYWORDS = {
+    'traveler_type': [
+        ('family_with_kids', ['family', 'families', 'kids', 'children', 'with kids']),
+        ('couple', ['couple', 'couples', 'romantic', 'honeymoon']),
+        ('solo', ['solo', 'alone', 'single traveler']),
+        ('older_adults', ['seniors', 'older', 'elderly', 'retired']),
+        ('group_friends', ['friends', 'group', 'bachelor', 'bachelorette']),
+        ('business', ['business', 'work', 'conference', 'meeting'])
+    ],
+    'age_range': [
+        ('young_adults', ['young', 'millennials', '20s', '30s']),
+        ('middle_aged', ['middle.?aged', '40s', '50s']),
+        ('seniors', ['seniors', 'older', 'elderly', '60s', '70s', '80s'])
+    ],
+    'mobility_requirements': [
+        ('wheelchair_accessible', ['wheelchair', 'accessible', 'disability']),
+        ('limited_mobility', ['limited mobility', 'walking difficulties']),
+        ('active', ['active', 'hiking', 'adventure', 'sports'])
+    ],
+    'seasonal_preferences': [
+        ('summer', ['summer', 'june', 'july', 'august']),
+        ('winter', ['winter', 'december', 'january', 'february']),
+        ('spring', ['spring', 'march', 'april', 'may']),
+        ('fall', ['fall', 'autumn', 'september', 'october', 'november'])
+    ]
+}
+
+def _build_fallback_keyword_scanner():
+    """Compile every fallback keyword into one pattern so a single pass finds them all"""
+    # Keyword source -> [(field, priority, value)]; a keyword like "seniors" feeds more than one field
+    keyword_targets: Dict[str, List[Tuple[str, int, str]]] = {}
+    for field, values in FALLBACK_FIELD_KEYWORDS.items():
+        for priority, (value, keywords) in enumerate(values):
+            for keyword in keywords:
+                keyword_targets.setdefault(keyword, []).append((field, priority, value))
+    
+    # One named group per keyword, so the match's lastgroup indexes straight into the targets
+    keywords = list(keyword_targets)
+    pattern = re.compile(
+        r'\b(?:' + '|'.join(f'(?P<k{i}>{keyword})' for i, keyword in enumerate(keywords)) + r')\b',
+        re.IGNORECASE
+    )
+    return pattern, [keyword_targets[keyword] for keyword in keywords]
+
+FALLBACK_KEYWORD_PATTERN, FALLBACK_KEYWORD_TARGETS = _build_fallback_keyword_scanner()
+
 class DestinationResearchAgent:
     """Specialized agent for destination research and recommendation"""
     
@@ -82,53 +740,137 @@ class DestinationResearchAgent:
         self.mock_mode = mock_mode
         
         if not mock_mode:
+            # Imported here because langchain_openai dominates module import time and mock mode never needs it
+            from langchain_openai import ChatOpenAI
             self.llm = ChatOpenAI(
                 model=model_name,
                 temperature=0.3,
-                api_key=os.getenv("OPENAI_API_KEY")
+                api_key=os.getenv("OPENAI_API_KEY"),
+                cache=llm_response_cache
+            )
+            # Short schema-filling extraction calls can opt into a faster OpenAI service tier (e.g. "priority")
+            # without moving the long research calls off the default tier
+            extraction_service_tier = os.getenv("OPENAI_EXTRACTION_SERVICE_TIER")
+            self.extraction_llm = ChatOpenAI(
+                model=model_name,
+                temperature=0.3,
+                api_key=os.getenv("OPENAI_API_KEY"),
+                cache=llm_response_cache,
+                model_kwargs={"service_tier": extraction_service_tier}
+            ) if extraction_service_tier else self.llm
+            # Research + structuring in a single round-trip via native tool calling. Strict json_schema
+            # output isn't an option: it needs every field required and no open-ended dicts like seasonal_highlights
+            self.specific_research_llm = self.llm.with_structured_output(SpecificDestinationResearch)
+            self.multi_research_llm = self.llm.with_structured_output(MultiDestinationResearch)
+            # Parameters come back as a validated DestinationRequest through the same tool-calling path
+            self.parameter_llm = self.llm.with_structured_output(DestinationRequest)
+            # The classifier only answers with one label, so cap the completion instead of waiting on extra text
+            self.classifier_llm = self.llm.bind(max_tokens=6)
+            # Structuring research text for one destination; a reply that fails validation is retried once
+            self.destination_llm = self.extraction_llm.with_structured_output(DestinationOption).with_retry(
+                retry_if_exception_type=(OutputParserException, ValidationError),
+                wait_exponential_jitter=False,  # A malformed reply isn't rate limiting - retry straight away
+                stop_after_attempt=2
+            )
+            # Every destination in research text via native tool calling, so the field schema travels as the tool
+            # definition instead of prompt text; the arguments are streamed and parsed per destination
+            self.destinations_llm = self.extraction_llm.bind_tools(
+                [ExtractedDestinations], tool_choice="ExtractedDestinations"
             )
+            # Naming the destinations of many search results in one call instead of one call per result
+            self.destination_names_llm = self.extraction_llm.with_structured_output(ExtractedDestinationNames)
+            # Web search the research LLM can call itself instead of receiving a fixed set of results
+            self.research_tools = self._create_research_tools()
         else:
             self.llm = None
             from mock_data import mock_data
             self.mock_data = mock_data
         self.serpapi_key = os.getenv("SERPAPI_KEY")
-        self.preferences_manager = PreferencesManager(preferences_file)
-        self.feasibility_checker = FeasibilityChecker(preferences_file, mock_mode=mock_mode)
+        # Shared per preferences file, so creating another agent doesn't re-read preferences or rebuild API clients
+        self.preferences_manager = get_preferences_manager(preferences_file)
+        self.feasibility_checker = get_feasibility_checker(preferences_file, mock_mode=mock_mode)
+        # Shared pool for independent I/O-bound work (LLM calls, web searches)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Memoized LLM request analysis, keyed by whitespace-normalized request text
+        self._cached_request_type = functools.lru_cache(maxsize=4096)(self._classify_request_with_llm)
+        self._cached_parameters = functools.lru_cache(maxsize=4096)(self._extract_parameters_with_llm)
+        # Memoized structured extraction of research text; DestinationOptions are frozen, so hits can be shared
+        self._cached_destination = functools.lru_cache(maxsize=512)(self._extract_destination_with_llm)
+        self._cached_destinations = functools.lru_cache(maxsize=512)(self._extract_destinations_with_llm)
+        # Memoized SerpAPI image lookups per (destination, country)
+        self._cached_images = functools.lru_cache(maxsize=2048)(self._fetch_destination_images)
+        # Finished research results by request fingerprint: {key: (stored_at, result)}
+        self._result_cache: "OrderedDict[str, Tuple[float, DestinationResearchResult]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # LLM-extracted destination names by search result text: {result: name or None}
+        self._destination_names: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._destination_names_lock = threading.Lock()
+        # Keep-alive session so SerpAPI calls reuse pooled TCP/TLS connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
     
-    def search_web(self, query: str, num_results: int = 5) -> List[str]:
-        """Search the web for current information about destinations"""
+    def _create_research_tools(self):
+        """Create the tools the research LLM can call"""
+        @tool
+        def web_search(query: str, num_results: int = 3) -> str:
+            """Search the web for current travel information such as entry requirements, advisories and seasonal events"""
+            results = self.search_web(query, num_results=min(num_results, 5))
+            return "\n\n".join(results) if results else "No results found"
+        
+        return [web_search]
+    
+    def search_web(self, query: str, num_results: int = 5, force_refresh: bool = False) -> List[str]:
+        """Search the web for current information about destinations
+        
+        Results are cached for a day; pass force_refresh=True for time-sensitive queries such as travel advisories.
+        """
         if not self.serpapi_key:
             print("SerpAPI key not configured - using LLM knowledge only")
             return []
         
+        # Word case doesn't change the results, so overlapping queries built by different research
+        # steps ("Paris Travel guide" / "paris travel guide") share one cache entry. The query itself
+        # is sent with its case intact so operators like OR keep working.
+        query = normalize_search_query(query)
         try:
-            url = "https://serpapi.com/search"
-            params = {
-                "q": query,
-                "api_key": self.serpapi_key,
-                "num": num_results,
-                "engine": "google"
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            results = []
-            
-            if "organic_results" in data:
-                for result in data["organic_results"][:num_results]:
-                    title = result.get("title", "")
-                    snippet = result.get("snippet", "")
-                    link = result.get("link", "")
-                    results.append(f"Title: {title}\nSnippet: {snippet}\nSource: {link}")
-            
-            return results
-            
+            # Identical queries are served from the cache, or share a single in-flight request
+            return search_cache.get_or_fetch(
+                search_cache_key(query), num_results, lambda: self._fetch_search_results(query, num_results),
+                force_refresh=force_refresh
+            )
         except Exception as e:
             print(f"Web search error: {e}")
             return []
     
+    def _fetch_search_results(self, query: str, num_results: int) -> List[str]:
+        """Fetch organic search results from SerpAPI, raising on request errors"""
+        url = "https://serpapi.com/search"
+        params = {
+            "q": query,
+            "api_key": self.serpapi_key,
+            "num": num_results,
+            "engine": "google"
+        }
+        
+        response = self._session.get(url, params=params, timeout=SERPAPI_TIMEOUT)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        results = []
+        
+        if "organic_results" in data:
+            for result in data["organic_results"][:num_results]:
+                title = result.get("title", "")
+                snippet = result.get("snippet", "")
+                link = result.get("link", "")
+                results.append(f"Title: {title}\nSnippet: {snippet}\nSource: {link}")
+        
+        return results
+    
     def search_and_order_destinations(self, request: DestinationRequest) -> List[Dict[str, any]]:
         """Perform comprehensive web search and order results by criteria"""
         print(f"🔍 Performing comprehensive web search for destination research...")
@@ -136,29 +878,78 @@ class DestinationResearchAgent:
         # Define search queries based on request type and criteria
         search_queries = self._generate_search_queries(request)
         
-        all_results = []
+        # Perform each distinct search once, concurrently - each one is a SerpAPI round-trip. Queries that
+        # only differ in case or spacing share a search but are still scored with their own criteria.
+        # Local pool, as this may already run on a worker of self._executor
+        distinct_queries = {}
+        for q in search_queries:
+            distinct_queries.setdefault(search_cache_key(q["query"]), q["query"])
+        results_by_key = {}
+        if distinct_queries:
+            with ThreadPoolExecutor(max_workers=min(len(distinct_queries), 8)) as search_executor:
+                results_by_key = dict(zip(distinct_queries, search_executor.map(
+                    lambda query: self.search_web(query, num_results=3), distinct_queries.values()
+                )))
+        query_results = [results_by_key[search_cache_key(q["query"])] for q in search_queries]
+        
+        # Name every result up front so results the titles don't resolve share a single LLM call
+        destination_names = self._name_search_results(
+            [result for web_results in query_results for result in web_results]
+        )
         
-        # Perform multiple targeted searches
-        for query_info in search_queries:
-            query = query_info["query"]
-            criteria = query_info["criteria"]
-            weight = query_info["weight"]
-            
-            print(f"   🔎 Searching: {query}")
-            web_results = self.search_web(query, num_results=3)
-            
-            # Process and score each result
+        # Process and score each named result, lowercasing the request fields once for all of them
+        criterion_terms = self._criterion_terms(request)
+        all_results = []
+        for query_info, web_results in zip(search_queries, query_results):
+            logger.debug("Scoring %d results for: %s", len(web_results), query_info["query"])
             for result in web_results:
-                scored_result = self._score_result_by_criteria(result, request, criteria, weight)
+                if not destination_names.get(result):
+                    continue
+                scored_result = self._score_result_by_criteria(
+                    result, request, query_info["criteria"], query_info["weight"],
+                    destination_name=destination_names[result], criterion_terms=criterion_terms
+                )
                 if scored_result:
                     all_results.append(scored_result)
         
         # Remove duplicates and order by score
         unique_results = self._deduplicate_results(all_results)
-        ordered_results = sorted(unique_results, key=lambda x: x["score"], reverse=True)
         
-        print(f"   📊 Found {len(ordered_results)} unique destinations from web search")
-        return ordered_results[:10]  # Return top 10 results
+        print(f"   📊 Found {len(unique_results)} unique destinations from web search")
+        # Return top 10 results - selected without sorting the rest (ties keep their search order)
+        return heapq.nlargest(10, unique_results, key=lambda x: x["score"])
+    
+    def _name_search_results(self, results: List[str]) -> Dict[str, Optional[str]]:
+        """Map each search result to its destination name: from its title if possible, else one batched LLM call"""
+        names = {result: self._match_destination_name(result) for result in results}
+        
+        # Results named by an earlier LLM call don't need another one
+        unresolved = []
+        with self._destination_names_lock:
+            for result, name in names.items():
+                if name is not None:
+                    continue
+                if result in self._destination_names:
+                    self._destination_names.move_to_end(result)
+                    names[result] = self._destination_names[result]
+                else:
+                    unresolved.append(result)
+        if not unresolved:
+            return names
+        
+        try:
+            extracted = dict(zip(unresolved, self._extract_destination_names_batch(unresolved)))
+        except Exception as e:
+            print(f"⚠️ Batched destination name extraction failed, extracting one by one: {e}")
+            names.update((result, self._extract_destination_name(result)) for result in unresolved)
+            return names
+        
+        names.update(extracted)
+        with self._destination_names_lock:
+            self._destination_names.update(extracted)
+            while len(self._destination_names) > DESTINATION_NAME_CACHE_SIZE:
+                self._destination_names.popitem(last=False)
+        return names
     
     def _generate_search_queries(self, request: DestinationRequest) -> List[Dict[str, any]]:
         """Generate targeted search queries based on request criteria"""
@@ -234,20 +1025,30 @@ class DestinationResearchAgent:
         
         return queries
     
-    def _score_result_by_criteria(self, result: str, request: DestinationRequest, criteria: List[str], weight: float) -> Optional[Dict[str, any]]:
+    def _score_result_by_criteria(
+        self,
+        result: str,
+        request: DestinationRequest,
+        criteria: List[str],
+        weight: float,
+        destination_name: Optional[str] = None,
+        criterion_terms: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, any]]:
         """Score a web search result based on how well it matches the criteria"""
         try:
-            # Extract destination name from result
-            destination_name = self._extract_destination_name(result)
+            # Extract destination name from result unless the caller already has it
+            destination_name = destination_name or self._extract_destination_name(result)
             if not destination_name:
                 return None
             
             score = 0.0
             score_breakdown = {}
+            result_lower = result.lower()
+            criterion_terms = criterion_terms or self._criterion_terms(request)
             
             # Score based on criteria
             for criterion in criteria:
-                criterion_score = self._calculate_criterion_score(result, request, criterion)
+                criterion_score = self._calculate_criterion_score(result_lower, criterion_terms, criterion)
                 score_breakdown[criterion] = criterion_score
                 score += criterion_score
             
@@ -269,80 +1070,126 @@ class DestinationResearchAgent:
     
     def _extract_destination_name(self, result: str) -> Optional[str]:
         """Extract destination name from web search result"""
-        # Use LLM to extract destination name
-        prompt = f"""
-        Extract the main destination name from this web search result:
-        
-        {result}
-        
-        Return only the destination name (e.g., "Paris", "Tokyo", "Barcelona"). 
-        If no clear destination is mentioned, return "None".
-        """
+        # Most result titles name the place outright, so only ask the LLM when they don't
+        destination = self._match_destination_name(result)
+        if destination:
+            return destination
         
+        # Use LLM to extract destination name
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = self.llm.invoke([
+                SystemMessage(content=DESTINATION_NAME_SYSTEM_PROMPT),
+                HumanMessage(content=f"Web search result:\n{result}")
+            ])
             destination = response.content.strip()
             return destination if destination != "None" else None
-        except:
+        except Exception as e:
+            print(f"⚠️ Destination name extraction failed: {e}")
             return None
     
-    def _calculate_criterion_score(self, result: str, request: DestinationRequest, criterion: str) -> float:
-        """Calculate score for a specific criterion"""
-        result_lower = result.lower()
+    def _extract_destination_names_batch(self, results: List[str]) -> List[Optional[str]]:
+        """Extract destination names for several search results in one LLM call, aligned with results
         
+        Raises OutputParserException when the reply doesn't have one name per result.
+        """
+        numbered_results = "\n\n".join(f"{i}. {result}" for i, result in enumerate(results, 1))
+        extracted = self.destination_names_llm.invoke([
+            SystemMessage(content=DESTINATION_NAMES_SYSTEM_PROMPT),
+            HumanMessage(content=f"Web search results:\n\n{numbered_results}")
+        ])
+        if extracted is None or len(extracted.names) != len(results):
+            raise OutputParserException("Destination names don't line up with the search results")
+        
+        names = [(name or "").strip() for name in extracted.names]
+        return [name if name and name != "None" else None for name in names]
+    
+    def _match_destination_name(self, result: str) -> Optional[str]:
+        """Find the destination named in a search result's title: a known destination, or a "City, ST" place"""
+        title_match = SEARCH_RESULT_TITLE_PATTERN.search(result)
+        if not title_match:
+            return None
+        title = title_match.group(1)
+        
+        # Places after "from"/"near" are the origin or a reference point ("Weekend Getaways from San Francisco")
+        folded = fold_text(title)
+        for match in KNOWN_DESTINATION_PATTERN.finditer(folded):
+            if not folded[:match.start()].endswith(("from ", "near ")):
+                return KNOWN_DESTINATION_NAMES[match.group(1)]
+        
+        for match in TITLE_PLACE_PATTERN.finditer(title):
+            words = match.group(1).split()
+            leading_words = []
+            while words and words[0] in TITLE_STOPWORDS:
+                leading_words.append(words.pop(0))
+            preceding = leading_words[-1].lower() + " " if leading_words else title[:match.start()].lower()
+            if words and not preceding.endswith(("from ", "near ")):
+                return " ".join(words)
+        return None
+    
+    def _criterion_terms(self, request: DestinationRequest) -> Dict[str, Any]:
+        """Lowercase the request fields _calculate_criterion_score compares against, once per search"""
+        season = request.seasonal_preferences or request.travel_dates
+        return {
+            "budget": request.budget.lower() if request.budget else None,
+            "interests": [interest.lower() for interest in request.interests],
+            "traveler_type": request.traveler_type.lower() if request.traveler_type else None,
+            "season": season.lower() if season else None,
+            "has_travel_time": bool(request.max_travel_time and request.origin_location),
+            "has_mobility_requirements": bool(request.mobility_requirements)
+        }
+    
+    def _calculate_criterion_score(self, result_lower: str, criterion_terms: Dict[str, Any], criterion: str) -> float:
+        """Calculate score for a specific criterion on a lowercased search result"""
         if criterion == "general":
             return 0.5  # Base score for general relevance
         
         elif criterion == "budget":
-            if request.budget:
-                budget_lower = request.budget.lower()
-                if "budget" in budget_lower and ("budget" in result_lower or "cheap" in result_lower or "affordable" in result_lower):
+            budget_lower = criterion_terms["budget"]
+            if budget_lower:
+                if "budget" in budget_lower and CRITERION_KEYWORD_PATTERNS["budget"].search(result_lower):
                     return 1.0
-                elif "luxury" in budget_lower and ("luxury" in result_lower or "expensive" in result_lower or "premium" in result_lower):
+                elif "luxury" in budget_lower and CRITERION_KEYWORD_PATTERNS["luxury"].search(result_lower):
                     return 1.0
-                elif "$" in request.budget and ("$" in result or "cost" in result_lower or "price" in result_lower):
+                elif "$" in budget_lower and CRITERION_KEYWORD_PATTERNS["price"].search(result_lower):
                     return 0.8
             return 0.3
         
         elif criterion == "interests":
-            if request.interests:
-                for interest in request.interests:
-                    if interest.lower() in result_lower:
-                        return 1.0
+            for interest in criterion_terms["interests"]:
+                if interest in result_lower:
+                    return 1.0
             return 0.3
         
         elif criterion == "traveler_type":
-            if request.traveler_type:
-                traveler_lower = request.traveler_type.lower()
+            traveler_lower = criterion_terms["traveler_type"]
+            if traveler_lower:
                 if traveler_lower in result_lower:
                     return 1.0
-                elif "family" in traveler_lower and ("family" in result_lower or "kids" in result_lower or "children" in result_lower):
+                elif "family" in traveler_lower and CRITERION_KEYWORD_PATTERNS["family"].search(result_lower):
                     return 0.9
-                elif "solo" in traveler_lower and ("solo" in result_lower or "single" in result_lower or "backpacker" in result_lower):
+                elif "solo" in traveler_lower and CRITERION_KEYWORD_PATTERNS["solo"].search(result_lower):
                     return 0.9
             return 0.3
         
         elif criterion == "seasonal":
-            if request.seasonal_preferences or request.travel_dates:
-                season = (request.seasonal_preferences or request.travel_dates).lower()
+            season = criterion_terms["season"]
+            if season:
                 if season in result_lower:
                     return 1.0
-                elif "summer" in season and ("summer" in result_lower or "warm" in result_lower):
+                elif "summer" in season and CRITERION_KEYWORD_PATTERNS["summer"].search(result_lower):
                     return 0.8
-                elif "winter" in season and ("winter" in result_lower or "snow" in result_lower or "cold" in result_lower):
+                elif "winter" in season and CRITERION_KEYWORD_PATTERNS["winter"].search(result_lower):
                     return 0.8
             return 0.3
         
         elif criterion == "travel_time":
-            if request.max_travel_time and request.origin_location:
-                if "hour" in result_lower or "flight" in result_lower or "distance" in result_lower:
-                    return 0.8
+            if criterion_terms["has_travel_time"] and CRITERION_KEYWORD_PATTERNS["travel_time"].search(result_lower):
+                return 0.8
             return 0.3
         
         elif criterion == "accessibility":
-            if request.mobility_requirements:
-                if "accessible" in result_lower or "wheelchair" in result_lower or "mobility" in result_lower:
-                    return 1.0
+            if criterion_terms["has_mobility_requirements"] and CRITERION_KEYWORD_PATTERNS["accessibility"].search(result_lower):
+                return 1.0
             return 0.5
         
         return 0.3  # Default score
@@ -365,90 +1212,79 @@ class DestinationResearchAgent:
     
     def _search_destination_images(self, destination_name: str, country: str = None) -> Dict[str, str]:
         """Search for destination images using web search"""
-        try:
-            # Create search query for destination images
-            search_query = f"{destination_name} {country or ''} travel destination photos".strip()
-            print(f"   📸 Searching for images: {search_query}")
-            
-            # Use SerpAPI for image search
-            serpapi_key = os.getenv('SERPAPI_API_KEY')
-            if not serpapi_key:
-                print("   ⚠️  SERPAPI_API_KEY not found, using LLM fallback for images")
-                return self._llm_image_lookup(destination_name, country)
-            
-            params = {
-                'q': search_query,
-                'api_key': serpapi_key,
-                'tbm': 'isch',  # Image search
-                'num': 5
-            }
-            
-            response = requests.get('https://serpapi.com/search', params=params)
-            if response.status_code == 200:
-                data = response.json()
-                images = data.get('images_results', [])
-                
-                if images:
-                    # Get the first few high-quality images
-                    image_urls = []
-                    for img in images[:3]:  # Get top 3 images
-                        if img.get('original'):
-                            image_urls.append(img['original'])
-                        elif img.get('link'):
-                            image_urls.append(img['link'])
-                    
-                    if image_urls:
-                        return {
-                            "primary": image_urls[0],
-                            "additional": image_urls[1:] if len(image_urls) > 1 else []
-                        }
-            
-            print(f"   ⚠️  No images found for {destination_name}")
+        # Use SerpAPI for image search
+        serpapi_key = os.getenv('SERPAPI_API_KEY')
+        if not serpapi_key:
+            print("   ⚠️  SERPAPI_API_KEY not found, using LLM fallback for images")
             return self._llm_image_lookup(destination_name, country)
-            
+        
+        try:
+            # Destinations recur across requests, so repeat lookups skip the SerpAPI round-trip
+            images = self._cached_images(destination_name, country, serpapi_key)
         except Exception as e:
             print(f"   ❌ Error searching for images: {e}")
             return self._llm_image_lookup(destination_name, country)
+        
+        if not images:
+            print(f"   ⚠️  No images found for {destination_name}")
+            return self._llm_image_lookup(destination_name, country)
+        # Copies so callers can't change the cached URLs
+        return {"primary": images["primary"], "additional": list(images["additional"])}
+    
+    def _fetch_destination_images(self, destination_name: str, country: Optional[str], serpapi_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch up to 3 image URLs from SerpAPI, or None if there are none (memoized per agent via self._cached_images)
+        
+        Request errors raise, so failed lookups aren't memoized.
+        """
+        # Create search query for destination images
+        search_query = f"{destination_name} {country or ''} travel destination photos".strip()
+        logger.debug("Searching for images: %s", search_query)
+        
+        params = {
+            'q': search_query,
+            'api_key': serpapi_key,
+            'tbm': 'isch',  # Image search
+            'num': 5,
+            # Only the fields we read, so SerpAPI doesn't send (and we don't decode) the whole result page
+            'json_restrictor': 'images_results[0:3].{original,link}'
+        }
+        
+        response = self._session.get('https://serpapi.com/search', params=params, timeout=SERPAPI_TIMEOUT)
+        response.raise_for_status()
+        images = orjson.loads(response.content).get('images_results', [])
+        
+        # Get the first few high-quality images
+        image_urls = []
+        for img in images[:3]:  # Get top 3 images
+            if img.get('original'):
+                image_urls.append(img['original'])
+            elif img.get('link'):
+                image_urls.append(img['link'])
+        
+        if not image_urls:
+            return None
+        return {
+            "primary": image_urls[0],
+            "additional": tuple(image_urls[1:])
+        }
     
     def _llm_image_lookup(self, destination_name: str, country: str = None) -> Dict[str, str]:
         """Use LLM to suggest image search terms when web search is not available"""
         try:
-            prompt = f"""
-            Suggest image search terms for this destination: {destination_name}, {country or ''}
-            
-            Return a JSON object with search terms that would help find good travel photos:
-            {{
-                "search_terms": ["term1", "term2", "term3"],
-                "description": "Brief description of what images to look for"
-            }}
-            
-            Focus on:
-            - Famous landmarks or attractions
-            - Beautiful scenery or landscapes
-            - Cultural highlights
-            - Popular tourist spots
-            
-            Return only the JSON, no additional text.
-            """
-            
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = self.llm.invoke([
+                SystemMessage(content=IMAGE_SEARCH_TERMS_SYSTEM_PROMPT),
+                HumanMessage(content=f"Destination: {destination_name}, {country or ''}")
+            ])
             
             # Parse the JSON response
-            import json
-            import re
-            
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                print(f"   🧠 LLM suggested image search terms: {result.get('search_terms', [])}")
-                return {
-                    "primary": None,  # No actual image URL
-                    "additional": [],
-                    "search_terms": result.get('search_terms', []),
-                    "description": result.get('description', '')
-                }
-            else:
-                return {"primary": None, "additional": []}
+            result = parse_llm_json(response.content)
+            print(f"   🧠 LLM suggested image search terms: {result.get('search_terms', [])}")
+            return {
+                "primary": None,  # No actual image URL
+                "additional": [],
+                "search_terms": result.get('search_terms', []),
+                "description": result.get('description', '')
+            }
                 
         except Exception as e:
             print(f"   ❌ Error in LLM image lookup: {e}")
@@ -472,398 +1308,382 @@ class DestinationResearchAgent:
     
     def get_current_travel_info(self, destination: str) -> str:
         """Get current travel information for a destination"""
-        web_queries = [
-            f"{destination} travel guide 2024",
-            f"{destination} best time to visit current",
-            f"{destination} travel requirements visa 2024",
-            f"{destination} safety travel advisory current"
-        ]
-        
-        web_results = []
-        for query in web_queries:
-            results = self.search_web(query, num_results=2)
-            web_results.extend(results)
+        # One search covers the guide, timing, visa and safety topics that used to be four
+        # separate SerpAPI requests. Google's OR only joins the words either side of it, so each
+        # topic is a quoted phrase - unquoted, every other word of every topic would be required.
+        query = f'{destination} travel guide {CURRENT_YEAR} ("best time to visit" OR "visa requirements" OR "travel advisory")'
+        web_results = self.search_web(query, num_results=8)
         
         return "\n\n".join(web_results) if web_results else ""
     
+    def _invoke_research_llm(self, messages: List[Any], token_callback: Optional[Callable[[str], None]] = None) -> AIMessage:
+        """Invoke the research LLM, streaming tokens to token_callback as they are generated"""
+        if token_callback is None:
+            return self.llm.invoke(messages)
+        
+        response = None
+        for chunk in self.llm.stream(messages):
+            if chunk.content:
+                token_callback(chunk.content)
+            response = chunk if response is None else response + chunk
+        return response
+    
+    def _research_with_web_search(self, messages: List[Any], output_schema: type) -> Optional[BaseModel]:
+        """Research with the LLM issuing its own web searches, returning output_schema or None to fall back"""
+        if not self.serpapi_key:
+            return None
+        
+        tools_by_name = {research_tool.name: research_tool for research_tool in self.research_tools}
+        schema_name = output_schema.__name__
+        try:
+            # The model either answers straight away or asks for the searches it needs first
+            response = self.llm.bind_tools(self.research_tools + [output_schema], tool_choice="any").invoke(messages)
+            search_calls = [call for call in response.tool_calls if call["name"] in tools_by_name]
+            
+            if search_calls and not any(call["name"] == schema_name for call in response.tool_calls):
+                allowed_calls = search_calls[:MAX_RESEARCH_SEARCHES]
+                print(f"🔎 Research LLM requested {len(search_calls)} web searches, running {len(allowed_calls)}")
+                # Local pool - this may already be running on a worker of self._executor
+                with ThreadPoolExecutor(max_workers=MAX_RESEARCH_SEARCHES) as search_executor:
+                    outputs = list(search_executor.map(
+                        lambda call: tools_by_name[call["name"]].invoke(call["args"]), allowed_calls
+                    ))
+                # Every tool call needs a reply, including the ones over the limit
+                outputs += ["Search limit reached - answer with the information gathered so far"] * (len(search_calls) - len(allowed_calls))
+                tool_messages = [
+                    ToolMessage(content=output, tool_call_id=call["id"])
+                    for call, output in zip(search_calls, outputs)
+                ]
+                response = self.llm.bind_tools(
+                    self.research_tools + [output_schema], tool_choice=schema_name
+                ).invoke(messages + [response] + tool_messages)
+            
+            answer = next(call for call in response.tool_calls if call["name"] == schema_name)
+            return output_schema(**answer["args"])
+        except Exception as e:
+            print(f"❌ Tool-assisted research failed: {e}")
+            return None
+    
+    def _research_multiple_destinations(
+        self,
+        messages: List[Any],
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, List[DestinationOption]]:
+        """Get written recommendations and structured destinations from a single LLM call"""
+        try:
+            research = self.multi_research_llm.invoke(messages)
+        except Exception as e:
+            print(f"❌ Structured multi-destination research failed: {e}")
+            research = None
+        
+        if research is not None and research.destinations:
+            print(f"✅ Received {len(research.destinations)} structured destinations from research call")
+            if token_callback:
+                # Structured output arrives whole, so hand the recommendations over in one piece
+                token_callback(research.travel_recommendations)
+            return research.travel_recommendations, research.destinations[:5]  # Limit to 5 destinations
+        
+        # Fall back to free-text research followed by a separate extraction call
+        response = self._invoke_research_llm(messages, token_callback)
+        return response.content, self._create_multiple_destinations_from_llm(response.content)
+    
     def _validate_destination_constraints(self, destinations: List[DestinationOption], request: DestinationRequest) -> List[DestinationOption]:
         """Validate that destinations meet the specified constraints"""
-        print(f"🔍 Validating {len(destinations)} destinations against constraints...")
-        print(f"   Origin: {request.origin_location}")
-        print(f"   Max travel time: {request.max_travel_time}")
+        print(f"🔍 Validating {len(destinations)} destinations against constraints "
+              f"(origin: {request.origin_location}, max travel time: {request.max_travel_time})...")
         
         if not request.max_travel_time or not request.origin_location:
             print("   ⚠️ No constraints specified, returning all destinations")
             return destinations
         
         # Parse travel time constraint (e.g., "3 hours" -> 3)
-        try:
-            time_parts = request.max_travel_time.lower().split()
-            max_hours = None
-            for part in time_parts:
-                if part.isdigit():
-                    max_hours = int(part)
-                    break
-            if not max_hours:
-                print("   ⚠️ Could not parse travel time, returning all destinations")
-                return destinations
-            print(f"   📏 Parsed max travel time: {max_hours} hours")
-        except:
-            print("   ⚠️ Error parsing travel time, returning all destinations")
+        max_hours = self._parse_hours(request.max_travel_time)
+        if not max_hours:
+            print("   ⚠️ Could not parse travel time, returning all destinations")
             return destinations
+        logger.debug("Parsed max travel time: %s hours", max_hours)
         
-        # Common travel time mappings for major origins
-        origin = request.origin_location.upper()
-        valid_destinations = []
-        
-        # More comprehensive invalid destination lists
-        invalid_destinations_sfo = [
-            'GREECE', 'HYDRA', 'EUROPE', 'FRANCE', 'ITALY', 'SPAIN', 'GERMANY', 'PORTUGAL',
-            'ASIA', 'JAPAN', 'CHINA', 'KOREA', 'THAILAND', 'SINGAPORE', 'VIETNAM', 'INDIA',
-            'AUSTRALIA', 'NEW ZEALAND', 'AFRICA', 'SOUTH AMERICA', 'BRAZIL', 'ARGENTINA',
-            'RUSSIA', 'TURKEY', 'ISRAEL', 'EGYPT', 'MOROCCO', 'SOUTH AFRICA'
-        ]
-        
-        invalid_destinations_nyc = [
-            'EUROPE', 'FRANCE', 'ITALY', 'SPAIN', 'GERMANY', 'GREECE', 'PORTUGAL', 'NETHERLANDS',
-            'ASIA', 'JAPAN', 'CHINA', 'KOREA', 'THAILAND', 'SINGAPORE', 'VIETNAM', 'INDIA',
-            'AUSTRALIA', 'NEW ZEALAND', 'AFRICA', 'SOUTH AMERICA', 'BRAZIL', 'ARGENTINA',
-            'RUSSIA', 'TURKEY', 'ISRAEL', 'EGYPT', 'MOROCCO', 'SOUTH AFRICA'
-        ]
+        # Resolve the origin once; origins without a known list accept every destination
+        invalid_pattern = INVALID_DESTINATION_PATTERNS.get(ORIGIN_ALIASES.get(request.origin_location.upper()))
+        if not invalid_pattern:
+            print(f"   📊 Validation complete: {len(destinations)}/{len(destinations)} destinations passed")
+            return destinations
         
+        # Check name, country, and region for obviously invalid destinations based on origin,
+        # reporting only the ones filtered out rather than every destination checked
+        valid_destinations = []
         for dest in destinations:
-            dest_name = dest.name.upper()
-            dest_country = dest.country.upper() if dest.country else ""
-            dest_region = dest.region.upper() if dest.region else ""
-            
-            print(f"   🔍 Checking: {dest.name} ({dest.country}, {dest.region})")
-            
-            is_valid = True
-            
-            # Check for obviously invalid destinations based on origin
-            if origin in ['SFO', 'SAN FRANCISCO', 'CALIFORNIA']:
-                # Check name, country, and region
-                all_dest_text = f"{dest_name} {dest_country} {dest_region}"
-                
-                if any(invalid in all_dest_text for invalid in invalid_destinations_sfo):
-                    is_valid = False
-                    print(f"   ❌ Filtered out {dest.name} - not within {request.max_travel_time} of {request.origin_location}")
-                    print(f"      Matched invalid term in: {all_dest_text}")
-            
-            elif origin in ['NYC', 'NEW YORK', 'JFK', 'LGA']:
-                # Check name, country, and region
-                all_dest_text = f"{dest_name} {dest_country} {dest_region}"
-                
-                if any(invalid in all_dest_text for invalid in invalid_destinations_nyc):
-                    is_valid = False
-                    print(f"   ❌ Filtered out {dest.name} - not within {request.max_travel_time} of {request.origin_location}")
-                    print(f"      Matched invalid term in: {all_dest_text}")
-            
-            if is_valid:
+            all_dest_text = f"{dest.name} {dest.country or ''} {dest.region or ''}".upper()
+            invalid_match = invalid_pattern.search(all_dest_text)
+            if invalid_match:
+                logger.debug("Filtered out %s - matched '%s', not within %s of %s",
+                             dest.name, invalid_match.group(1), request.max_travel_time, request.origin_location)
+            else:
                 valid_destinations.append(dest)
-                print(f"   ✅ Valid: {dest.name}")
         
         print(f"   📊 Validation complete: {len(valid_destinations)}/{len(destinations)} destinations passed")
         return valid_destinations
     
     
+    def _parse_hours(self, travel_time: str) -> Optional[float]:
+        """Return the hours in a travel time such as "3 hours", "3h" or "90 minutes", or None if there are none"""
+        match = TRAVEL_DURATION_PATTERN.search(travel_time)
+        if not match:
+            return None
+        unit = (match.group(2) or 'h')[0].lower()
+        return float(match.group(1)) * TRAVEL_DURATION_UNIT_HOURS[unit]
+    
+    def _normalize_request(self, user_request: str) -> str:
+        """Collapse whitespace so trivially different copies of a request share memoized results
+        
+        Case is kept: airport codes and capitalized place names carry meaning for the classifiers.
+        """
+        return " ".join(user_request.split())
+    
     def analyze_request_type(self, user_request: str) -> str:
         """Analyze the type of destination request"""
-        prompt = f"""
-        Analyze this travel request and determine the type of destination inquiry:
+        user_request = self._normalize_request(user_request)
+        request_type = self._classify_without_llm(user_request)
+        if request_type:
+            print(f"⚡ Request classified as '{request_type}' without an LLM call")
+            return request_type
         
-        Request: "{user_request}"
-        
-        Classify as one of these types:
-        1. "specific" - User mentions a specific destination (e.g., "Paris", "Tokyo", "New York")
-        2. "abstract" - User describes desired characteristics (e.g., "sunny beach", "mountain destination", "cultural city")
-        3. "multi_location" - User mentions multiple destinations or wants to compare options
-        4. "constrained" - User has specific constraints (time, distance, budget) but flexible on destination
+        return self._cached_request_type(user_request)
+    
+    def _classify_without_llm(self, user_request: str) -> Optional[str]:
+        """Classify unambiguous requests with the quick regexes and known destinations, or return None"""
+        for pattern, request_type in QUICK_REQUEST_CLASSIFIERS:
+            if pattern.search(user_request):
+                return request_type
+        return self._classify_by_known_destinations(user_request)
+    
+    def _classify_by_known_destinations(self, user_request: str) -> Optional[str]:
+        """Classify requests that name well-known destinations, or return None to ask the LLM
         
-        Respond with just the type: specific, abstract, multi_location, or constrained
+        Two or more named destinations are a comparison; a single one with no descriptive words
+        ("Paris", "Fly from London to Zurich") is a specific request. Places after "from", and a
+        first place followed by "to" another one ("New York to Paris"), are origins.
         """
+        folded = fold_text(user_request)
+        if DESTINATION_DESCRIPTOR_PATTERN.search(folded):
+            return None
+        matches = list(KNOWN_DESTINATION_PATTERN.finditer(folded))
+        destinations = set()
+        for i, match in enumerate(matches):
+            if folded[:match.start()].endswith("from "):
+                continue
+            if i == 0 and len(matches) > 1 and ROUTE_SEPARATOR_PATTERN.match(folded, match.end()):
+                continue
+            destinations.add(match.group(1))
+        if len(destinations) >= 2:
+            return "multi_location"
+        if len(destinations) == 1:
+            return "specific"
+        return None
+    
+    def _classify_request_with_llm(self, user_request: str) -> str:
+        """Ask the LLM for the request type (memoized per agent via self._cached_request_type)"""
+        response = self.classifier_llm.invoke([
+            SystemMessage(content=REQUEST_TYPE_SYSTEM_PROMPT),
+            HumanMessage(content=f'Request: "{user_request}"')
+        ])
+        # Tolerate answers like "Multi-location" or a trailing period
+        answer = REQUEST_TYPE_SEPARATOR_PATTERN.sub('_', response.content.strip().lower())
+        return next((request_type for request_type in REQUEST_TYPES if request_type in answer), answer)
+    
+    def _extract_parameters_with_llm(self, user_request: str) -> bytes:
+        """Ask the LLM for request parameters (memoized per agent via self._cached_parameters)
         
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        return response.content.strip().lower()
+        Returns the parameters serialized with orjson, so every caller rebuilds its own
+        DestinationRequest - the validation helpers update requests in place.
+        """
+        request = self.parameter_llm.invoke([
+            SystemMessage(content=PARAMETER_EXTRACTION_SYSTEM_PROMPT),
+            HumanMessage(content=f'Request: "{user_request}"')
+        ])
+        if request is None:
+            # The model answered in text instead of calling the schema tool; raising keeps it out of the memo
+            raise OutputParserException("No parameters returned by the extraction call")
+        return orjson.dumps(request.model_dump())
+    
+    def _format_parameters_for_ui(self, params_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Return only meaningful parameters for UI display"""
+        filtered = {}
+        for key, value in params_dict.items():
+            if value is None:
+                continue
+            if isinstance(value, str) and not value.strip():
+                continue
+            if isinstance(value, (list, tuple, set, dict)) and not value:
+                continue
+            filtered[key] = value
+        return filtered
+    
+    def _send_parameters_update(self, progress_callback, message: str, params: Dict[str, Any], query: Optional[str] = None):
+        """Send extracted parameters to the UI, if a progress callback was provided"""
+        if not progress_callback:
+            return
+        details = {field: params.get(field) or 'N/A' for field in (
+            'query', 'origin_location', 'budget', 'travel_dates', 'group_size', 'traveler_type'
+        )}
+        if query is not None:
+            details['query'] = query
+        progress_callback({
+            'type': 'progress_update',
+            'message': message,
+            'details': PARAMETERS_DETAILS_TEMPLATE.format(**details),
+            'parameters': self._format_parameters_for_ui(params)
+        })
     
     def extract_destination_parameters(self, user_request: str, progress_callback=None) -> DestinationRequest:
         """Extract structured parameters from the user request"""
-        
-        def format_parameters_for_ui(params_dict):
-            """Return only meaningful parameters for UI display"""
-            filtered = {}
-            for key, value in params_dict.items():
-                if value is None:
-                    continue
-                if isinstance(value, str) and not value.strip():
-                    continue
-                if isinstance(value, (list, tuple, set, dict)) and not value:
-                    continue
-                filtered[key] = value
-            return filtered
-
         if self.mock_mode:
             print(f"🎭 MOCK MODE: Using mock extracted parameters")
             params = self.mock_data.get_mock_extracted_parameters(user_request)
             
-            # Send extracted parameters to UI if callback provided
-            if progress_callback:
-                print(f"   📤 Sending mock extracted parameters to UI via progress callback")
-                ui_parameters = format_parameters_for_ui(params)
-                progress_callback({
-                    'type': 'progress_update',
-                    'message': '✅ Successfully extracted travel parameters (MOCK MODE)',
-                    'details': f"Query: {params.get('query', 'N/A')} | Origin: {params.get('origin_location', 'N/A')} | Budget: {params.get('budget', 'N/A')} | Dates: {params.get('travel_dates', 'N/A')} | Group Size: {params.get('group_size', 'N/A')} | Traveler Type: {params.get('traveler_type', 'N/A')}",
-                    'parameters': ui_parameters
-                })
-                print(f"   ✅ Mock progress callback sent successfully")
+            self._send_parameters_update(
+                progress_callback, '✅ Successfully extracted travel parameters (MOCK MODE)', params
+            )
             
-            return DestinationRequest(**params)
-        
-        prompt = f"""
-        Extract destination research parameters from this travel request:
-        
-        Request: "{user_request}"
-        
-        Extract and return a JSON object with these fields:
-        {{
-            "query": "The main destination query or description",
-            "origin_location": "Starting location if mentioned (e.g., 'SFO', 'New York', 'London')",
-            "max_travel_time": "Maximum travel time if specified (e.g., '3 hours', '5 hours')",
-            "travel_dates": "Travel dates if mentioned (e.g., 'June 2024', 'summer', 'next month')",
-            "budget": "Budget constraints if mentioned (e.g., '$2000', 'budget-friendly', 'luxury')",
-            "interests": ["List of interests mentioned (e.g., 'beaches', 'history', 'food')"],
-            "travel_style": "Travel style if mentioned (e.g., 'relaxing', 'adventure', 'cultural')",
-            "traveler_type": "Type of travelers if mentioned (e.g., 'family_with_kids', 'couple', 'solo', 'older_adults', 'group_friends', 'business')",
-            "group_size": "Number of people traveling if mentioned (e.g., 2, 4, 6)",
-            "age_range": "Age range if mentioned (e.g., 'young_adults', 'middle_aged', 'seniors', 'mixed_ages')",
-            "mobility_requirements": "Mobility needs if mentioned (e.g., 'wheelchair_accessible', 'limited_mobility', 'active', 'any')",
-            "seasonal_preferences": "Season preference if mentioned (e.g., 'summer', 'winter', 'spring', 'fall', 'any')"
-        }}
-        
-        If a field is not mentioned, use null. Be specific and accurate.
-        """
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+            return DestinationRequest.model_validate(params)
         
         try:
-            import json
-            # Clean up the response to extract JSON
-            content = response.content.strip()
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
-            
-            params = json.loads(content)
-            print(f"✅ Successfully parsed parameters: {params}")
-            
-            # Send extracted parameters to UI if callback provided
-            if progress_callback:
-                print(f"   📤 Sending extracted parameters to UI via progress callback")
-                ui_parameters = format_parameters_for_ui(params)
-                progress_callback({
-                    'type': 'progress_update',
-                    'message': '✅ Successfully extracted travel parameters',
-                    'details': f"Query: {params.get('query', 'N/A')} | Origin: {params.get('origin_location', 'N/A')} | Budget: {params.get('budget', 'N/A')} | Dates: {params.get('travel_dates', 'N/A')} | Group Size: {params.get('group_size', 'N/A')} | Traveler Type: {params.get('traveler_type', 'N/A')}",
-                    'parameters': ui_parameters
-                })
-                print(f"   ✅ Progress callback sent successfully")
-            else:
-                print(f"   ⚠️ No progress callback provided")
-            
-            return DestinationRequest(**params)
-        except Exception as e:
-            print(f"❌ JSON parsing failed: {e}")
-            print(f"   Raw response: {response.content}")
-            
-            # Enhanced fallback parsing with regex
-            import re
-            
-            # Extract origin location
-            origin_location = None
-            origin_patterns = [
-                r'from\s+([A-Z]{3})',  # "from SFO"
-                r'from\s+([A-Za-z\s]+)',  # "from San Francisco"
-                r'([A-Z]{3})\s+to',  # "SFO to"
-                r'([A-Za-z\s]+)\s+to'  # "San Francisco to"
-            ]
-            
-            for pattern in origin_patterns:
-                match = re.search(pattern, user_request, re.IGNORECASE)
-                if match:
-                    origin_location = match.group(1).strip()
-                    break
-            
-            # Extract travel time
-            max_travel_time = None
-            time_patterns = [
-                r'within\s+(\d+\s+hours?)',  # "within 3 hours"
-                r'(\d+\s+hours?)\s+from',  # "3 hours from"
-                r'(\d+\s+hours?)\s+flight',  # "3 hours flight"
-                r'(\d+\s+hours?)\s+drive'  # "3 hours drive"
-            ]
-            
-            for pattern in time_patterns:
-                match = re.search(pattern, user_request, re.IGNORECASE)
-                if match:
-                    max_travel_time = match.group(1).strip()
-                    break
-            
-            print(f"   Fallback parsing - Origin: {origin_location}, Travel time: {max_travel_time}")
-            
-            # Extract traveler type and demographics
-            traveler_type = None
-            group_size = None
-            age_range = None
-            mobility_requirements = None
-            seasonal_preferences = None
-            
-            # Traveler type patterns
-            traveler_patterns = [
-                (r'\b(family|families|kids|children|with kids)\b', 'family_with_kids'),
-                (r'\b(couple|couples|romantic|honeymoon)\b', 'couple'),
-                (r'\b(solo|alone|single traveler)\b', 'solo'),
-                (r'\b(seniors|older|elderly|retired)\b', 'older_adults'),
-                (r'\b(friends|group|bachelor|bachelorette)\b', 'group_friends'),
-                (r'\b(business|work|conference|meeting)\b', 'business')
-            ]
-            
-            for pattern, traveler_type_val in traveler_patterns:
-                if re.search(pattern, user_request, re.IGNORECASE):
-                    traveler_type = traveler_type_val
-                    break
-            
-            # Group size patterns
-            group_size_match = re.search(r'\b(\d+)\s*(people|travelers|guests|adults)\b', user_request, re.IGNORECASE)
-            if group_size_match:
-                group_size = int(group_size_match.group(1))
-            
-            # Age range patterns
-            age_patterns = [
-                (r'\b(young|millennials|20s|30s)\b', 'young_adults'),
-                (r'\b(middle.?aged|40s|50s)\b', 'middle_aged'),
-                (r'\b(seniors|older|elderly|60s|70s|80s)\b', 'seniors')
-            ]
-            
-            for pattern, age_range_val in age_patterns:
-                if re.search(pattern, user_request, re.IGNORECASE):
-                    age_range = age_range_val
-                    break
-            
-            # Mobility requirements patterns
-            mobility_patterns = [
-                (r'\b(wheelchair|accessible|disability)\b', 'wheelchair_accessible'),
-                (r'\b(limited mobility|walking difficulties)\b', 'limited_mobility'),
-                (r'\b(active|hiking|adventure|sports)\b', 'active')
-            ]
-            
-            for pattern, mobility_val in mobility_patterns:
-                if re.search(pattern, user_request, re.IGNORECASE):
-                    mobility_requirements = mobility_val
-                    break
-            
-            # Seasonal preferences patterns
-            seasonal_patterns = [
-                (r'\b(summer|june|july|august)\b', 'summer'),
-                (r'\b(winter|december|january|february)\b', 'winter'),
-                (r'\b(spring|march|april|may)\b', 'spring'),
-                (r'\b(fall|autumn|september|october|november)\b', 'fall')
-            ]
-            
-            for pattern, seasonal_val in seasonal_patterns:
-                if re.search(pattern, user_request, re.IGNORECASE):
-                    seasonal_preferences = seasonal_val
-                    break
-            
-            print(f"   Enhanced fallback parsing:")
-            print(f"      Traveler type: {traveler_type}")
-            print(f"      Group size: {group_size}")
-            print(f"      Age range: {age_range}")
-            print(f"      Mobility: {mobility_requirements}")
-            print(f"      Seasonal: {seasonal_preferences}")
-            
-            # Send extracted parameters to UI if callback provided (fallback parsing)
-            if progress_callback:
-                print(f"   📤 Sending extracted parameters to UI via progress callback (fallback)")
-                fallback_params = {
-                    'query': user_request,
-                    'origin_location': origin_location,
-                    'max_travel_time': max_travel_time,
-                    'travel_dates': None,
-                    'budget': None,
-                    'interests': [],
-                    'travel_style': None,
-                    'traveler_type': traveler_type,
-                    'group_size': group_size,
-                    'age_range': age_range,
-                    'mobility_requirements': mobility_requirements,
-                    'seasonal_preferences': seasonal_preferences
-                }
-                ui_parameters = format_parameters_for_ui(fallback_params)
-                progress_callback({
-                    'type': 'progress_update',
-                    'message': '✅ Successfully extracted travel parameters (fallback parsing)',
-                    'details': f"Query: {user_request[:50]}... | Origin: {origin_location or 'N/A'} | Budget: N/A | Dates: N/A | Group Size: {group_size or 'N/A'} | Traveler Type: {traveler_type or 'N/A'}",
-                    'parameters': ui_parameters
-                })
-                print(f"   ✅ Progress callback sent successfully (fallback)")
-            else:
-                print(f"   ⚠️ No progress callback provided (fallback)")
-            
-            return DestinationRequest(
-                query=user_request,
-                origin_location=origin_location,
-                max_travel_time=max_travel_time,
-                travel_dates=None,
-                budget=None,
-                interests=[],
-                travel_style=None,
-                traveler_type=traveler_type,
-                group_size=group_size,
-                age_range=age_range,
-                mobility_requirements=mobility_requirements,
-                seasonal_preferences=seasonal_preferences
-            )
-    
-    def research_specific_destination(self, request: DestinationRequest) -> DestinationResearchResult:
-        """Research a specific destination mentioned by the user"""
+            # Keep the plain dict alongside the request - the UI only shows fields the LLM filled in
+            params = orjson.loads(self._cached_parameters(self._normalize_request(user_request)))
+            # The memo holds a dump of an already-validated DestinationRequest, so skip re-validation
+            request_params = DestinationRequest.model_construct(**params)
+        except (OutputParserException, ValidationError) as e:
+            print(f"❌ Parameter extraction failed: {e}")
+            return self._fallback_destination_parameters(user_request, progress_callback)
         
-        # Get current web information
-        current_info = self.get_current_travel_info(request.query)
+        logger.debug("Successfully parsed parameters: %s", params)
         
-        prompt = f"""
-        Research the destination: {request.query}
+        self._send_parameters_update(progress_callback, '✅ Successfully extracted travel parameters', params)
         
-        Use your knowledge and the current information provided below to give comprehensive details about this destination.
-        
-        Current Web Information:
-        {current_info if current_info else "No current web information available - rely on your knowledge"}
+        return request_params
+    
+    def _fallback_destination_parameters(self, user_request: str, progress_callback=None) -> DestinationRequest:
+        """Extract request parameters with the precompiled regexes when LLM extraction fails"""
+        # Extract origin location
+        origin_location = None
+        for pattern in ORIGIN_PATTERNS:
+            match = pattern.search(user_request)
+            if match:
+                origin_location = match.group(1).strip()
+                break
+        
+        # Extract travel time
+        max_travel_time = None
+        for pattern in TRAVEL_TIME_PATTERNS:
+            match = pattern.search(user_request)
+            if match:
+                max_travel_time = match.group(1).strip()
+                break
+        
+        logger.debug("Fallback parsing - origin: %s, travel time: %s", origin_location, max_travel_time)
+        
+        # Extract traveler type and demographics in a single keyword scan
+        keyword_fields = self._scan_fallback_keywords(user_request)
+        traveler_type = keyword_fields.get('traveler_type')
+        age_range = keyword_fields.get('age_range')
+        mobility_requirements = keyword_fields.get('mobility_requirements')
+        seasonal_preferences = keyword_fields.get('seasonal_preferences')
+        
+        group_size = None
+        group_size_match = GROUP_SIZE_PATTERN.search(user_request)
+        if group_size_match:
+            group_size = int(group_size_match.group(1))
+        
+        logger.debug(
+            "Enhanced fallback parsing - traveler type: %s, group size: %s, age range: %s, mobility: %s, seasonal: %s",
+            traveler_type, group_size, age_range, mobility_requirements, seasonal_preferences
+        )
         
-        Provide detailed information about:
-        - Best time to visit (consider current year 2024)
-        - Key attractions and activities
-        - Climate and weather patterns
-        - Visa requirements and entry procedures
-        - Language and currency
-        - Safety considerations and travel advisories
-        - Estimated costs for different budget levels
-        - Local transportation options
-        - Cultural highlights and experiences
-        - Why it's recommended for travel
+        params = {
+            'query': user_request,
+            'origin_location': origin_location,
+            'max_travel_time': max_travel_time,
+            'travel_dates': None,
+            'budget': None,
+            'interests': [],
+            'travel_style': None,
+            'traveler_type': traveler_type,
+            'group_size': group_size,
+            'age_range': age_range,
+            'mobility_requirements': mobility_requirements,
+            'seasonal_preferences': seasonal_preferences
+        }
+        self._send_parameters_update(
+            progress_callback, '✅ Successfully extracted travel parameters (fallback parsing)', params,
+            query=f"{user_request[:50]}..."
+        )
         
-        If origin_location is provided ({request.origin_location}), include travel time and transportation options.
-        If budget is specified ({request.budget}), tailor recommendations accordingly.
-        If interests are mentioned ({request.interests}), focus on relevant attractions and activities.
+        # Every field was built above with its declared type, so skip validation
+        return DestinationRequest.model_construct(**params)
+    
+    def _scan_fallback_keywords(self, user_request: str) -> Dict[str, str]:
+        """Map fallback fields to their highest-priority keyword value found in the request"""
+        best_matches: Dict[str, Tuple[int, str]] = {}
+        settled_fields = 0
+        for match in FALLBACK_KEYWORD_PATTERN.finditer(user_request):
+            for field, priority, value in FALLBACK_KEYWORD_TARGETS[int(match.lastgroup[1:])]:
+                if field not in best_matches or priority < best_matches[field][0]:
+                    best_matches[field] = (priority, value)
+                    if priority == 0:
+                        settled_fields += 1
+            # Once every field holds its top-priority value nothing later in the text can change the result
+            if settled_fields == len(FALLBACK_FIELD_KEYWORDS):
+                break
+        return {field: value for field, (priority, value) in best_matches.items()}
+    
+    def _prompt_fields(self, request: DestinationRequest) -> Dict[str, Any]:
+        """Request fields for the prompt templates, with unset fields shown as 'Not specified'"""
+        return {field: value or 'Not specified' for field, value in request.model_dump().items()}
+    
+    def research_specific_destination(
+        self,
+        request: DestinationRequest,
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> DestinationResearchResult:
+        """Research a specific destination mentioned by the user"""
         
-        Provide a comprehensive, up-to-date destination profile based on your knowledge and current information.
-        """
+        request_details = SPECIFIC_RESEARCH_REQUEST_TEMPLATE.format(**self._prompt_fields(request))
         
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+        # Let the model search for what it needs before falling back to the fixed web lookup
+        research = self._research_with_web_search([
+            SystemMessage(content=SPECIFIC_RESEARCH_SYSTEM_PROMPT),
+            HumanMessage(content=request_details)
+        ], SpecificDestinationResearch)
         
-        # Create structured destination data from LLM response
-        destination = self._create_destination_from_llm_response(response.content, request.query)
+        if research is None:
+            # Get current web information
+            current_info = self.get_current_travel_info(request.query)
+            
+            messages = [
+                SystemMessage(content=SPECIFIC_RESEARCH_SYSTEM_PROMPT),
+                HumanMessage(content=WEB_INFORMATION_TEMPLATE.format(
+                    request_details=request_details,
+                    current_info=current_info or NO_WEB_INFORMATION
+                ))
+            ]
+            
+            try:
+                research = self.specific_research_llm.invoke(messages)
+            except Exception as e:
+                print(f"❌ Structured destination research failed: {e}")
+                research = None
+        
+        if research is not None:
+            destination = research.destination
+            travel_recommendations = research.travel_recommendations
+            if token_callback:
+                # Structured output arrives whole, so hand the profile over in one piece
+                token_callback(travel_recommendations)
+        else:
+            # Fall back to free-text research followed by a separate extraction call
+            response = self._invoke_research_llm(messages, token_callback)
+            destination = self._create_destination_from_llm_response(response.content, request.query)
+            travel_recommendations = response.content
         
         # For specific destinations, usually no choice needed unless multiple locations found
         all_destinations = [destination]
@@ -872,107 +1692,40 @@ class DestinationResearchAgent:
             request_type="specific",
             primary_destinations=[destination],
             alternative_destinations=[],
-            travel_recommendations=response.content,
+            travel_recommendations=travel_recommendations,
             user_choice_required=len(all_destinations) > 1
         )
     
-    def research_abstract_destination(self, request: DestinationRequest) -> DestinationResearchResult:
+    def research_abstract_destination(
+        self,
+        request: DestinationRequest,
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> DestinationResearchResult:
         """Research destinations based on abstract criteria"""
         
         # Perform comprehensive web search and ordering
         web_search_results = self.search_and_order_destinations(request)
         
-        # Get current travel information for top results
+        # Get current travel information for top results concurrently
         top_destinations = [result["destination_name"] for result in web_search_results[:5]]
-        current_info = []
-        for dest in top_destinations:
-            dest_info = self.get_current_travel_info(dest)
-            current_info.extend(dest_info)
+        info_futures = [self._executor.submit(self.get_current_travel_info, dest) for dest in top_destinations]
         
-        # Create web search context
+        # Create web search context while the lookups are in flight
         web_context = self._create_web_search_context(web_search_results)
         
-        prompt = f"""
-        Find destinations that match these criteria:
-        
-        Query: {request.query}
-        Origin: {request.origin_location or 'Not specified'}
-        Max travel time: {request.max_travel_time or 'Not specified'}
-        Budget: {request.budget or 'Not specified'}
-        Interests: {request.interests or 'Not specified'}
-        Travel style: {request.travel_style or 'Not specified'}
-        Traveler type: {request.traveler_type or 'Not specified'}
-        Group size: {request.group_size or 'Not specified'}
-        Age range: {request.age_range or 'Not specified'}
-        Mobility requirements: {request.mobility_requirements or 'Not specified'}
-        Seasonal preferences: {request.seasonal_preferences or 'Not specified'}
-        Travel dates: {request.travel_dates or 'Not specified'}
-        
-        WEB SEARCH RESULTS (ordered by relevance to criteria):
-        {web_context}
-        
-        Current Travel Information:
-        {chr(10).join(current_info) if current_info else "No current web information available - rely on your knowledge"}
-        
-        IMPORTANT CONSTRAINTS:
-        - If a maximum travel time is specified ({request.max_travel_time}), ONLY recommend destinations that are actually within that travel time from the origin ({request.origin_location})
-        - For example, if origin is SFO and max travel time is 3 hours, destinations like Greece, Europe, or Asia are NOT acceptable
-        - Only recommend destinations that are realistically reachable within the specified time constraint
-        - If no destinations meet the time constraint, say so clearly
-        
-        TRAVELER-SPECIFIC CONSIDERATIONS:
-        - Consider the traveler type ({request.traveler_type}) when ranking destinations
-        - For families with kids: prioritize family-friendly activities, safety, and kid-appropriate attractions
-        - For couples: consider romantic appeal, adult-oriented activities, and intimate settings
-        - For solo travelers: focus on safety, social opportunities, and solo-friendly activities
-        - For older adults: consider accessibility, comfort, and less physically demanding activities
-        - For groups of friends: look for social activities, nightlife, and group-friendly accommodations
-        - For business travelers: prioritize convenience, business facilities, and professional amenities
-        
-        PREFERENCES-BASED CONSIDERATIONS:
-        - Hotel preferences: Consider preferred hotel chains and loyalty programs
-        - Flight preferences: Consider airline alliances, class preferences, and red-eye preferences
-        - Budget preferences: Align recommendations with budget level and spending patterns
-        - Activity preferences: Match outdoor/indoor activities and adventure level
-        - Cultural preferences: Consider cultural sensitivity and authentic experiences
-        - Safety preferences: Prioritize safety-conscious recommendations
-        - Technology preferences: Consider digital-friendly destinations and connectivity
-        - Environmental preferences: Factor in eco-conscious and sustainable options
-        
-        SEASONAL CONSIDERATIONS:
-        - Consider the time of year ({request.seasonal_preferences or request.travel_dates}) when ranking destinations
-        - Factor in weather conditions, crowd levels, and seasonal activities
-        - Adjust recommendations based on peak/off-peak seasons
-        - Consider seasonal pricing and availability
-        
-        EVALUATION INSTRUCTIONS:
-        1. Review the web search results above, which are already ordered by relevance to your criteria
-        2. Evaluate each destination in the order presented, considering how well it matches the specific criteria
-        3. Focus on destinations that appear early in the ordered list as they scored highest for relevance
-        4. Use both the web search information and your knowledge to provide comprehensive recommendations
-        
-        Use your knowledge and current information to provide 3-5 destination recommendations that match ALL criteria.
-        For each destination, include:
-        - Name and location
-        - Why it matches the criteria (especially for the specific traveler type)
-        - Best time to visit (consider current year 2024 and seasonal factors)
-        - Key attractions and activities (tailored to traveler type)
-        - EXACT travel time from origin (if specified) - be accurate
-        - Estimated costs for different budget levels
-        - Climate and weather (consider seasonal variations)
-        - Safety considerations (especially important for families and solo travelers)
-        - Family-friendliness score (1-10) if applicable
-        - Accessibility features if mobility requirements are specified
-        - Seasonal highlights and crowd levels
-        - Unique selling points for the specific traveler type
-        
-        Rank them by how well they match the criteria, considering both the basic requirements AND the traveler demographics and seasonal factors.
-        """
+        current_info = [dest_info for dest_info in (future.result() for future in info_futures) if dest_info]
         
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+        criteria = ABSTRACT_RESEARCH_REQUEST_TEMPLATE.format(
+            **self._prompt_fields(request),
+            web_context=web_context,
+            current_info="\n".join(current_info) if current_info else NO_WEB_INFORMATION
+        )
         
-        # Create structured destinations from LLM response
-        destinations = self._create_multiple_destinations_from_llm(response.content)
+        # Research and structure the destinations in one round-trip
+        travel_recommendations, destinations = self._research_multiple_destinations([
+            SystemMessage(content=ABSTRACT_RESEARCH_SYSTEM_PROMPT),
+            HumanMessage(content=criteria)
+        ], token_callback)
         
         # Validate destinations against constraints
         validated_destinations = self._validate_destination_constraints(destinations, request)
@@ -984,41 +1737,39 @@ class DestinationResearchAgent:
             request_type="abstract",
             primary_destinations=validated_destinations[:3],  # Top 3
             alternative_destinations=validated_destinations[3:],  # Rest as alternatives
-            travel_recommendations=response.content,
+            travel_recommendations=travel_recommendations,
             user_choice_required=len(all_destinations) > 1
         )
     
-    def research_multi_location(self, request: DestinationRequest) -> DestinationResearchResult:
+    def research_multi_location(
+        self,
+        request: DestinationRequest,
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> DestinationResearchResult:
         """Research multiple destinations or provide comparisons"""
         
-        # Get current information for comparison
-        current_info = self.get_current_travel_info(request.query)
-        
-        prompt = f"""
-        Analyze this multi-location travel request: {request.query}
-        
-        Current Web Information:
-        {current_info if current_info else "No current web information available - rely on your knowledge"}
-        
-        If multiple specific destinations are mentioned, provide detailed comparison using current information.
-        If the user wants to choose between options, provide pros/cons for each.
-        
-        For each destination, include:
-        - Overview and highlights
-        - Best time to visit (consider current year 2024)
-        - Key attractions and activities
-        - Travel logistics (if origin specified)
-        - Costs and budget considerations
-        - Safety and current travel conditions
-        - Unique selling points
-        - Current travel requirements and advisories
-        
-        Provide a comprehensive comparison summary highlighting differences, current conditions, and recommendations.
-        """
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        
-        destinations = self._create_multiple_destinations_from_llm(response.content)
+        # Let the model search for what it needs before falling back to the fixed web lookup
+        research = self._research_with_web_search([
+            SystemMessage(content=MULTI_LOCATION_SYSTEM_PROMPT),
+            HumanMessage(content=MULTI_LOCATION_REQUEST_TEMPLATE.format(query=request.query))
+        ], MultiDestinationResearch)
+        
+        if research is not None and research.destinations:
+            travel_recommendations, destinations = research.travel_recommendations, research.destinations[:5]
+            if token_callback:
+                # Structured output arrives whole, so hand the comparison over in one piece
+                token_callback(travel_recommendations)
+        else:
+            # Get current information for comparison
+            current_info = self.get_current_travel_info(request.query)
+            
+            travel_recommendations, destinations = self._research_multiple_destinations([
+                SystemMessage(content=MULTI_LOCATION_SYSTEM_PROMPT),
+                HumanMessage(content=WEB_INFORMATION_TEMPLATE.format(
+                    request_details=MULTI_LOCATION_REQUEST_TEMPLATE.format(query=request.query),
+                    current_info=current_info or NO_WEB_INFORMATION
+                ))
+            ], token_callback)
         
         # For multi-location requests, always require user choice
         all_destinations = destinations
@@ -1027,66 +1778,44 @@ class DestinationResearchAgent:
             request_type="multi_location",
             primary_destinations=destinations,
             alternative_destinations=[],
-            travel_recommendations=response.content,
-            comparison_summary=self._extract_comparison_summary(response.content),
+            travel_recommendations=travel_recommendations,
+            comparison_summary=self._extract_comparison_summary(travel_recommendations),
             user_choice_required=len(all_destinations) > 1
         )
     
-    def research_constrained_destination(self, request: DestinationRequest) -> DestinationResearchResult:
+    def research_constrained_destination(
+        self,
+        request: DestinationRequest,
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> DestinationResearchResult:
         """Research destinations with specific constraints"""
         
         # Perform comprehensive web search and ordering
         web_search_results = self.search_and_order_destinations(request)
         
-        # Get current travel information for top results
+        # Get current travel information for top results concurrently
         top_destinations = [result["destination_name"] for result in web_search_results[:5]]
-        current_info = []
-        for dest in top_destinations:
-            dest_info = self.get_current_travel_info(dest)
-            current_info.extend(dest_info)
+        info_futures = [self._executor.submit(self.get_current_travel_info, dest) for dest in top_destinations]
         
-        # Create web search context
+        # Create web search context while the lookups are in flight
         web_context = self._create_web_search_context(web_search_results)
         
-        prompt = f"""
-        Find destinations that meet these specific constraints:
-        
-        Origin: {request.origin_location}
-        Max travel time: {request.max_travel_time}
-        Budget: {request.budget or 'Flexible'}
-        Interests: {request.interests or 'General travel'}
-        Travel style: {request.travel_style or 'Not specified'}
-        
-        WEB SEARCH RESULTS (ordered by relevance to constraints):
-        {web_context}
-        
-        Current Travel Information:
-        {chr(10).join(current_info) if current_info else "No current web information available - rely on your knowledge"}
-        
-        EVALUATION INSTRUCTIONS:
-        1. Review the web search results above, which are already ordered by relevance to your constraints
-        2. Evaluate each destination in the order presented, focusing on constraint compliance
-        3. Prioritize destinations that appear early in the ordered list as they scored highest for constraint relevance
-        4. Use both the web search information and your knowledge to provide comprehensive recommendations
-        
-        Focus on destinations that are:
-        1. Within the specified travel time from origin
-        2. Match the budget constraints
-        3. Align with interests and travel style
-        4. Currently accessible and safe to visit
-        
-        Use your knowledge and current information to provide 3-5 options ranked by how well they meet the constraints.
-        Include:
-        - Exact travel time from origin
-        - Current costs and budget considerations
-        - Why each destination fits the criteria
-        - Current travel conditions and requirements
-        - Best time to visit considering constraints
-        """
+        current_info = [dest_info for dest_info in (future.result() for future in info_futures) if dest_info]
         
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+        constraints = CONSTRAINED_RESEARCH_REQUEST_TEMPLATE.format(
+            origin_location=request.origin_location,
+            max_travel_time=request.max_travel_time,
+            budget=request.budget or 'Flexible',
+            interests=request.interests or 'General travel',
+            travel_style=request.travel_style or 'Not specified',
+            web_context=web_context,
+            current_info="\n".join(current_info) if current_info else NO_WEB_INFORMATION
+        )
         
-        destinations = self._create_multiple_destinations_from_llm(response.content)
+        travel_recommendations, destinations = self._research_multiple_destinations([
+            SystemMessage(content=CONSTRAINED_RESEARCH_SYSTEM_PROMPT),
+            HumanMessage(content=constraints)
+        ], token_callback)
         
         # Validate destinations against constraints
         validated_destinations = self._validate_destination_constraints(destinations, request)
@@ -1098,73 +1827,53 @@ class DestinationResearchAgent:
             request_type="constrained",
             primary_destinations=validated_destinations[:3],
             alternative_destinations=validated_destinations[3:],
-            travel_recommendations=response.content,
+            travel_recommendations=travel_recommendations,
             user_choice_required=len(all_destinations) > 1
         )
     
     def _parse_smart_dates(self, date_input: str) -> str:
         """Parse date input intelligently based on current date"""
-        if not date_input or date_input.strip() == "":
+        normalized = date_input.strip().lower() if date_input else ""
+        if not normalized:
             return date_input
+        date_input = normalized
         
-        date_input = date_input.strip().lower()
-        current_date = datetime.now()
-        current_year = current_date.year
-        current_month = current_date.month
+        # Find the first year, season and month mentioned in a single scan
+        terms = {}
+        for match in DATE_TERM_PATTERN.finditer(date_input):
+            terms.setdefault(match.lastgroup, match.group(match.lastgroup))
         
         # If already has a year, return as is
-        if re.search(r'\b(20\d{2})\b', date_input):
+        if 'year' in terms:
             return date_input
         
-        # Handle seasons
-        season_mappings = {
-            'spring': {'months': [3, 4, 5], 'name': 'Spring'},
-            'summer': {'months': [6, 7, 8], 'name': 'Summer'},
-            'fall': {'months': [9, 10, 11], 'name': 'Fall'},
-            'autumn': {'months': [9, 10, 11], 'name': 'Fall'},
-            'winter': {'months': [12, 1, 2], 'name': 'Winter'}
-        }
+        # Only read the clock once the input actually needs resolving
+        current_date = datetime.now()
+        current_year = current_date.year
+        current_month = current_date.month
         
-        for season, info in season_mappings.items():
-            if season in date_input:
-                # Check if we're currently in this season
-                if current_month in info['months']:
-                    # We're in the season, use next year
-                    return f"{info['name']} {current_year + 1}"
-                else:
-                    # We're not in the season, check if it's coming up this year
-                    next_season_month = min([m for m in info['months'] if m > current_month], default=min(info['months']))
-                    if next_season_month > current_month:
-                        # Season is coming up this year
-                        return f"{info['name']} {current_year}"
-                    else:
-                        # Season already passed this year, use next year
-                        return f"{info['name']} {current_year + 1}"
+        # Handle seasons
+        if 'season' in terms:
+            season_name, season_months = DATE_SEASONS[terms['season']]
+            if current_month in season_months:
+                # We're in the season, use next year
+                return f"{season_name} {current_year + 1}"
+            elif any(month > current_month for month in season_months):
+                # Season is coming up this year
+                return f"{season_name} {current_year}"
+            else:
+                # Season already passed this year, use next year
+                return f"{season_name} {current_year + 1}"
         
         # Handle months
-        month_mappings = {
-            'january': 1, 'jan': 1,
-            'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'may': 5,
-            'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'sept': 9,
-            'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'december': 12, 'dec': 12
-        }
-        
-        for month_name, month_num in month_mappings.items():
-            if month_name in date_input:
-                if month_num > current_month:
-                    # Month is coming up this year
-                    return f"{month_name.title()} {current_year}"
-                else:
-                    # Month already passed this year, use next year
-                    return f"{month_name.title()} {current_year + 1}"
+        if 'month' in terms:
+            month_name = terms['month']
+            if DATE_MONTHS[month_name] > current_month:
+                # Month is coming up this year
+                return f"{month_name.title()} {current_year}"
+            else:
+                # Month already passed this year, use next year
+                return f"{month_name.title()} {current_year + 1}"
         
         # Handle relative terms
         if 'next month' in date_input:
@@ -1184,7 +1893,7 @@ class DestinationResearchAgent:
     def _validate_travel_dates(self, request_params: DestinationRequest) -> Optional[str]:
         """Check if travel dates are specified and return error message if not"""
         if not request_params.travel_dates or request_params.travel_dates.strip() == "":
-            return "Travel dates are required to proceed with destination research and feasibility checking. Please specify your travel dates (e.g., 'June 2024', 'summer', 'next month', 'March 15-20, 2024')."
+            return f"Travel dates are required to proceed with destination research and feasibility checking. Please specify your travel dates (e.g., 'June {CURRENT_YEAR}', 'summer', 'next month', 'March 15-20, {CURRENT_YEAR}')."
         
         # Parse the dates intelligently
         parsed_dates = self._parse_smart_dates(request_params.travel_dates)
@@ -1194,30 +1903,24 @@ class DestinationResearchAgent:
     
     def _validate_budget(self, request_params: DestinationRequest) -> Optional[str]:
         """Check if budget is specified and set default to luxury if not"""
-        if (not request_params.budget or 
-            request_params.budget.strip() == "" or 
-            request_params.budget.lower() == "none" or
-            request_params.budget.lower() == "not specified"):
+        if (request_params.budget or "").strip().lower() in MISSING_BUDGET_VALUES:
             # Set default budget to luxury
             request_params.budget = "luxury"
             print(f"   💰 No budget specified, using default: luxury")
         return None
     
     def _validate_origin(self, request_params: DestinationRequest) -> Optional[str]:
-        """Check if origin location is specified and return error message if not"""
+        """Check if origin location is specified, defaulting to the home airport, and return error message if not"""
         # Check if origin is provided in the request
-        if (request_params.origin_location and 
-            request_params.origin_location.strip() != "" and 
-            request_params.origin_location.lower() not in ["none", "not specified", "unknown"]):
+        if (request_params.origin_location or "").strip().lower() not in MISSING_ORIGIN_VALUES:
             return None
         
-        # Check if origin is available in user preferences
-        try:
-            preferences = self.preferences_manager.get_comprehensive_recommendations()
-            if preferences and preferences.get("home_airport") and preferences["home_airport"].strip() != "":
-                return None
-        except:
-            pass
+        # Fall back to the home airport from user preferences
+        home_airport = self.preferences_manager.preferences.traveler_profile.get("home_airport")
+        if isinstance(home_airport, str) and home_airport.strip() != "":
+            request_params.origin_location = home_airport.strip()
+            print(f"   ✈️ No origin specified, using home airport: {request_params.origin_location}")
+            return None
         
         # If no origin found, return error message
         return "Origin location is required to proceed with destination research and feasibility checking. Please specify your departure location (e.g., 'SFO', 'New York', 'London', 'LAX')."
@@ -1275,33 +1978,38 @@ class DestinationResearchAgent:
     def research_destination(
         self,
         user_request: str,
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        token_callback: Optional[Callable[[str], None]] = None
     ) -> DestinationResearchResult:
         """Main method to research destinations based on user request"""
+        result, _ = self._research_destination(user_request, progress_callback, token_callback)
+        return result
+    
+    def _research_destination(
+        self,
+        user_request: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        token_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[DestinationResearchResult, Optional[DestinationRequest]]:
+        """Research destinations, also returning the validated parameters the research used
+        
+        The parameters are None in mock mode, which doesn't extract them.
+        """
         print(f"🔍 Starting destination research for: {user_request}")
         
         if self.mock_mode:
             print(f"🎭 MOCK MODE: Using mock destination research")
-            return self._mock_research_destination(user_request, progress_callback)
+            return self._mock_research_destination(user_request, progress_callback), None
         
-        # Analyze request type
-        request_type = self.analyze_request_type(user_request)
+        # Request classification and parameter extraction are independent, so run them concurrently
+        request_type_future = self._executor.submit(self.analyze_request_type, user_request)
+        request_params_future = self._executor.submit(self.extract_destination_parameters, user_request, progress_callback)
+        
+        request_type = request_type_future.result()
         print(f"   📋 Request type: {request_type}")
         
-        # Extract parameters
-        request_params = self.extract_destination_parameters(user_request, progress_callback)
-        print(f"   📊 Extracted parameters:")
-        print(f"      Query: {request_params.query}")
-        print(f"      Origin: {request_params.origin_location}")
-        print(f"      Max travel time: {request_params.max_travel_time}")
-        print(f"      Budget: {request_params.budget}")
-        print(f"      Interests: {request_params.interests}")
-        print(f"      Traveler type: {request_params.traveler_type}")
-        print(f"      Group size: {request_params.group_size}")
-        print(f"      Age range: {request_params.age_range}")
-        print(f"      Mobility: {request_params.mobility_requirements}")
-        print(f"      Seasonal: {request_params.seasonal_preferences}")
-        print(f"      Travel dates: {request_params.travel_dates}")
+        request_params = request_params_future.result()
+        logger.debug("Extracted parameters: %s", request_params)
 
         if progress_callback:
             def _format_value(value: Any) -> Optional[str]:
@@ -1354,7 +2062,7 @@ class DestinationResearchAgent:
                 date_required=True,
                 budget_required=False,
                 origin_required=False
-            )
+            ), request_params
         
         # Validate budget
         budget_error = self._validate_budget(request_params)
@@ -1369,7 +2077,7 @@ class DestinationResearchAgent:
                 date_required=False,
                 budget_required=True,
                 origin_required=False
-            )
+            ), request_params
         
         # Validate origin
         origin_error = self._validate_origin(request_params)
@@ -1384,59 +2092,241 @@ class DestinationResearchAgent:
                 date_required=False,
                 budget_required=False,
                 origin_required=True
-            )
+            ), request_params
+        
+        # Identical requests reuse finished research instead of repeating the searches and LLM calls
+        cache_key = self._result_cache_key(request_type, request_params)
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            print("   ⚡ Reusing research from an identical earlier request")
+            if token_callback:
+                token_callback(cached_result.travel_recommendations)
+            return cached_result, request_params
         
         # Route to appropriate research method
         if request_type == "specific":
-            return self.research_specific_destination(request_params)
+            result = self.research_specific_destination(request_params, token_callback)
         elif request_type == "abstract":
-            return self.research_abstract_destination(request_params)
+            result = self.research_abstract_destination(request_params, token_callback)
         elif request_type == "multi_location":
-            return self.research_multi_location(request_params)
+            result = self.research_multi_location(request_params, token_callback)
         elif request_type == "constrained":
-            return self.research_constrained_destination(request_params)
+            result = self.research_constrained_destination(request_params, token_callback)
         else:
             # Default to abstract research
-            return self.research_abstract_destination(request_params)
+            result = self.research_abstract_destination(request_params, token_callback)
+        
+        # Don't pin empty results - a later attempt may succeed
+        if result.primary_destinations:
+            self._store_result(cache_key, result)
+        return result, request_params
     
-    def _create_destination_from_llm_response(self, response: str, destination_name: str) -> DestinationOption:
-        """Create structured destination data from LLM response"""
+    def _result_cache_key(self, request_type: str, request: DestinationRequest) -> str:
+        """Fingerprint a request by its type, extracted parameters and the current preferences"""
+        payload = {
+            "request_type": request_type,
+            "request": request.model_dump(),
+            "preferences": self.preferences_manager.fingerprint()
+        }
+        return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+    
+    def _get_cached_result(self, key: str) -> Optional[DestinationResearchResult]:
+        """Return a copy of a fresh cached result, or None on a miss"""
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.time() - stored_at >= RESULT_CACHE_TTL:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        # Copies so callers can't change the cached result
+        return result.model_copy(deep=True)
+    
+    def _store_result(self, key: str, result: DestinationResearchResult) -> None:
+        """Cache a finished result, evicting the least recently used"""
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.time(), result.model_copy(deep=True))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def research_destination_stream(self, user_request: str) -> Iterator[Dict[str, Any]]:
+        """Research destinations, yielding progress updates and research text as it is generated
         
-        # Use LLM to extract structured information
-        extraction_prompt = f"""
-        Extract structured information from this destination research response:
-        
-        Destination: {destination_name}
-        Response: {response}
-        
-        Extract and return a JSON object with these fields:
-        {{
-            "name": "{destination_name}",
-            "country": "Country name",
-            "region": "Region/state/province",
-            "description": "Brief description (max 200 chars)",
-            "best_time_to_visit": "Best time to visit",
-            "key_attractions": ["List of top 3-5 attractions"],
-            "activities": ["List of top 3-5 activities"],
-            "climate": "Climate description",
-            "visa_requirements": "Visa requirements",
-            "language": "Primary language",
-            "currency": "Local currency",
-            "safety_rating": "Safety rating/considerations",
-            "why_recommended": "Why this destination is recommended"
-        }}
+        Yields the same progress updates research_destination sends to its progress callback,
+        'research_chunk' updates carrying each piece of generated research text, and finally a
+        'research_complete' update carrying the DestinationResearchResult.
+        """
+        updates: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        outcome: Dict[str, Any] = {}
+        
+        def run_research():
+            try:
+                outcome["result"] = self.research_destination(
+                    user_request,
+                    progress_callback=updates.put,
+                    token_callback=lambda token: updates.put({'type': 'research_chunk', 'content': token})
+                )
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                updates.put(None)
+        
+        # Run on a dedicated thread so the shared executor stays free for the research fan-out
+        threading.Thread(target=run_research, daemon=True).start()
+        
+        while True:
+            update = updates.get()
+            if update is None:
+                break
+            yield update
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        
+        yield {'type': 'research_complete', 'result': outcome["result"]}
+    
+    def research_destination_batch(
+        self,
+        user_requests: List[str],
+        max_concurrency: int = 10
+    ) -> List[DestinationResearchResult]:
+        """Research several independent requests concurrently, returning results in request order
         
-        Base the information on the response content. If information is not available, use reasonable defaults.
+        At most max_concurrency requests are in flight at once to stay within OpenAI/SerpAPI rate limits.
+        The first failed request's error is raised once all requests have finished.
         """
+        if not user_requests:
+            return []
         
+        print(f"📦 Researching {len(user_requests)} requests (up to {max_concurrency} at a time)")
+        # Own pool rather than self._executor - each request fans out onto the shared executor itself
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(user_requests))) as batch_executor:
+            if not self.mock_mode:
+                # Classify and extract every request up front in one concurrent wave. This fills the
+                # memoized LLM results, so the research below doesn't queue 2 calls per request on the
+                # small shared executor
+                analysis_futures = [
+                    batch_executor.submit(analyze, user_request)
+                    for user_request in user_requests
+                    for analyze in (self.analyze_request_type, self.extract_destination_parameters)
+                ]
+                for future in analysis_futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        # research_destination repeats the call and surfaces the error for its request
+                        print(f"⚠️ Request analysis failed during batch prefetch: {e}")
+            
+            futures = [batch_executor.submit(self.research_destination, user_request) for user_request in user_requests]
+        return [future.result() for future in futures]
+    
+    def _extract_destination_with_llm(self, response: str, destination_name: str) -> DestinationOption:
+        """Ask the LLM to structure research text (memoized per agent via self._cached_destination)"""
+        destination = self.destination_llm.invoke([
+            SystemMessage(content=DESTINATION_EXTRACTION_SYSTEM_PROMPT),
+            HumanMessage(content=DESTINATION_EXTRACTION_REQUEST_TEMPLATE.format(
+                destination_name=destination_name, response=response
+            ))
+        ])
+        if destination is None:
+            # The model answered in text instead of calling the schema tool; raising keeps it out of the memo
+            raise OutputParserException("No destination returned by the extraction call")
+        return destination
+    
+    def _extract_destinations_with_llm(self, response: str) -> Tuple[DestinationOption, ...]:
+        """Ask the LLM for every destination in research text (memoized per agent via self._cached_destinations)
+        
+        The tool-call arguments are streamed and each destination validated as soon as its object is complete, so
+        generation stops once MAX_EXTRACTED_DESTINATIONS are in. Destinations that fail validation are skipped.
+        """
+        stream = self.destinations_llm.stream([
+            SystemMessage(content=MULTI_DESTINATION_EXTRACTION_SYSTEM_PROMPT),
+            HumanMessage(content=MULTI_DESTINATION_EXTRACTION_REQUEST_TEMPLATE.format(response=response))
+        ])
+        destinations = []
         try:
-            extraction_response = self.llm.invoke([HumanMessage(content=extraction_prompt)])
-            import json
-            data = json.loads(extraction_response.content)
-            return DestinationOption(**data)
-        except:
-            # Fallback to basic parsing
-            return DestinationOption(
+            arguments = (
+                tool_call_chunk["args"] or ""
+                for chunk in stream
+                for tool_call_chunk in chunk.tool_call_chunks
+            )
+            for object_json in iter_json_array_objects(arguments):
+                try:
+                    destinations.append(DestinationOption.model_validate_json(object_json))
+                except ValidationError as e:
+                    print(f"⚠️ Skipping an extracted destination that failed validation ({e.error_count()} errors)")
+                    continue
+                if len(destinations) == MAX_EXTRACTED_DESTINATIONS:
+                    break
+        finally:
+            # Closing the stream ends the request, so the model stops generating destinations we'd drop
+            stream.close()
+        
+        if not destinations:
+            # Raising keeps the failure out of the memo and sends the caller to its regex fallback
+            raise OutputParserException("No valid destinations in the extraction reply")
+        return tuple(destinations)
+    
+    def _try_deterministic_extract(self, response: str, destination_name: str) -> Optional[DestinationOption]:
+        """Build a DestinationOption from labeled lines and bullet lists in research text, without the LLM
+        
+        Returns None unless at least DETERMINISTIC_EXTRACTION_MIN_FIELDS fields could be filled.
+        """
+        fields: Dict[str, Any] = {"name": destination_name}
+        
+        # The first prose line is the description
+        for line in response.splitlines():
+            line = line.strip()
+            if line and not line.startswith(('#', '-', '*', '•', '|', '>')) and not DESTINATION_FIELD_PATTERN.match(line):
+                fields["description"] = line[:200]
+                break
+        
+        for match in DESTINATION_FIELD_PATTERN.finditer(response):
+            field = DESTINATION_FIELD_LABELS[match.group(1).lower()]
+            fields.setdefault(field, match.group(2).strip('* '))
+        
+        for match in DESTINATION_LIST_PATTERN.finditer(response):
+            field = "activities" if match.group(1).lower() in ("activities", "things to do") else "key_attractions"
+            items = [item.strip() for item in DESTINATION_LIST_ITEM_PATTERN.findall(match.group(2))]
+            if items and field not in fields:
+                fields[field] = items[:5]
+        
+        if len(fields) < DETERMINISTIC_EXTRACTION_MIN_FIELDS:
+            return None
+        
+        # Same defaults as the parsing fallback for anything the text didn't label
+        defaults = {
+            "country": "Unknown",
+            "region": "Unknown",
+            "description": response[:200],
+            "best_time_to_visit": "Year-round",
+            "climate": "Varies",
+            "visa_requirements": "Check with embassy",
+            "language": "Local language",
+            "currency": "Local currency",
+            "safety_rating": "Good",
+            "why_recommended": "See description"
+        }
+        return DestinationOption(**{**defaults, **fields})
+    
+    def _create_destination_from_llm_response(self, response: str, destination_name: str) -> DestinationOption:
+        """Create structured destination data from LLM response"""
+        # Well-labeled research text can be structured locally, skipping the extraction call
+        destination = self._try_deterministic_extract(response, destination_name)
+        if destination is not None:
+            print(f"✅ Extracted {destination_name} details from labeled research text")
+            return destination
+        
+        try:
+            # Identical research text (e.g. a cached research reply) reuses its earlier extraction
+            return self._cached_destination(response, destination_name)
+        except (OutputParserException, ValidationError) as e:
+            print(f"❌ Destination extraction failed: {e}")
+            # Fallback to basic parsing - every field is built here, so skip validation
+            return DestinationOption.model_construct(
                 name=destination_name,
                 country="Unknown",
                 region="Unknown",
@@ -1454,98 +2344,50 @@ class DestinationResearchAgent:
     
     def _create_multiple_destinations_from_llm(self, response: str) -> List[DestinationOption]:
         """Create multiple destinations from LLM response using structured extraction"""
-        
-        # Use LLM to extract multiple destinations
-        extraction_prompt = f"""
-        Extract multiple destinations from this research response:
-        
-        Response: {response}
-        
-        Return a JSON array of destination objects. Each object should have these fields:
-        {{
-            "name": "Destination name",
-            "country": "Country name",
-            "region": "Region/state/province",
-            "description": "Brief description (max 150 chars)",
-            "best_time_to_visit": "Best time to visit",
-            "key_attractions": ["List of top 3 attractions"],
-            "activities": ["List of top 3 activities"],
-            "climate": "Climate description",
-            "visa_requirements": "Visa requirements",
-            "language": "Primary language",
-            "currency": "Local currency",
-            "safety_rating": "Safety rating/considerations",
-            "why_recommended": "Why this destination is recommended",
-            "family_friendly_score": "Family-friendliness score (1-10, null if not applicable)",
-            "kid_friendly_activities": ["List of kid-friendly activities"],
-            "senior_friendly_features": ["List of senior-friendly features"],
-            "accessibility_features": ["List of accessibility features"],
-            "seasonal_highlights": {{"summer": "Summer highlights", "winter": "Winter highlights", "spring": "Spring highlights", "fall": "Fall highlights"}},
-            "crowd_levels": "Crowd levels (low/moderate/high/peak)",
-            "nightlife_rating": "Nightlife rating (none/limited/moderate/vibrant)",
-            "romantic_appeal": "Romantic appeal (low/moderate/high)",
-            "business_friendly": "Business-friendly (true/false/null)"
-        }}
-        
-        Extract all destinations mentioned in the response. If information is not available for a field, use reasonable defaults.
-        Return as a JSON array.
-        """
-        
         try:
-            extraction_response = self.llm.invoke([HumanMessage(content=extraction_prompt)])
-            import json
-            
-            # Clean up the response to extract JSON
-            content = extraction_response.content.strip()
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
-            
-            destinations_data = json.loads(content)
-            destinations = [DestinationOption(**dest) for dest in destinations_data]
+            destinations = self._cached_destinations(response)
             print(f"✅ Successfully extracted {len(destinations)} destinations from LLM response")
-            return destinations[:5]  # Limit to 5 destinations
-        except Exception as e:
+            return list(destinations)
+        except OutputParserException as e:
             print(f"❌ Destination extraction failed: {e}")
-            print(f"   Raw extraction response: {extraction_response.content if 'extraction_response' in locals() else 'No response'}")
             
             # Enhanced fallback parsing using regex to find destination names
-            import re
-            destinations = []
-            
-            # Look for patterns like "1. **Destination Name**" or "### 1. **Destination Name**"
-            destination_patterns = [
-                r'\d+\.\s*\*\*([^*]+)\*\*',  # "1. **Monterey, CA**"
-                r'###\s*\d+\.\s*\*\*([^*]+)\*\*',  # "### 1. **Monterey, CA**"
-                r'\*\*([^*]+)\*\*',  # "**Monterey, CA**"
-                r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})',  # "Monterey, CA"
+            # Numbered list items are the most likely destinations, then other bold text, then "City, ST" lines
+            numbered_names, bold_names, city_state_names = [], [], []
+            for match in DESTINATION_NAME_PATTERN.finditer(response):
+                numbered_prefix, bold_name, city_state_name = match.groups()
+                if city_state_name is not None:
+                    city_state_names.append(city_state_name.strip())
+                elif numbered_prefix:
+                    numbered_names.append(bold_name.strip())
+                else:
+                    bold_names.append(bold_name.strip())
+            
+            # Keep the first occurrence of each plausible name and only build the options we return
+            names = numbered_names + bold_names + city_state_names
+            unique_names = [name for name in dict.fromkeys(names) if len(name) > 2][:5]
+            # Stub options are built from known-good values, so skip validation
+            destinations = [
+                DestinationOption.model_construct(
+                    name=name,
+                    country="Unknown",
+                    region="Unknown",
+                    description="See full response",
+                    best_time_to_visit="Year-round",
+                    key_attractions=[],
+                    activities=[],
+                    climate="Varies",
+                    visa_requirements="Check with embassy",
+                    language="Local language",
+                    currency="Local currency",
+                    safety_rating="Good",
+                    why_recommended="See full response"
+                )
+                for name in unique_names
             ]
             
-            for pattern in destination_patterns:
-                matches = re.findall(pattern, response, re.MULTILINE)
-                for match in matches:
-                    dest_name = match.strip()
-                    if dest_name and len(dest_name) > 2 and dest_name not in [d.name for d in destinations]:
-                        destinations.append(DestinationOption(
-                            name=dest_name,
-                            country="Unknown",
-                            region="Unknown",
-                            description="See full response",
-                            best_time_to_visit="Year-round",
-                            key_attractions=[],
-                            activities=[],
-                            climate="Varies",
-                            visa_requirements="Check with embassy",
-                            language="Local language",
-                            currency="Local currency",
-                            safety_rating="Good",
-                            why_recommended="See full response"
-                        ))
-            
-            print(f"   Fallback parsing found {len(destinations)} destinations: {[d.name for d in destinations]}")
-            return destinations[:5]  # Limit to 5 destinations
+            print(f"   Fallback parsing found {len(destinations)} destinations: {unique_names}")
+            return destinations
     
     def _extract_comparison_summary(self, response: str) -> str:
         """Extract comparison summary from response"""
@@ -1568,7 +2410,7 @@ class DestinationResearchAgent:
         
         # First, do the normal destination research
         print(f"   🚀 Initializing destination research...")
-        initial_result = self.research_destination(
+        initial_result, request_params = self._research_destination(
             user_request,
             progress_callback=progress_callback
         )
@@ -1577,8 +2419,10 @@ class DestinationResearchAgent:
         if not check_feasibility:
             return initial_result
         
-        # Extract parameters for feasibility checking
-        request_params = self.extract_destination_parameters(user_request, progress_callback)
+        # Check feasibility with the validated parameters the research used (e.g. the default budget);
+        # only mock mode needs to extract them here
+        if request_params is None:
+            request_params = self.extract_destination_parameters(user_request, progress_callback)
         
         # Check feasibility for all primary destinations
         if initial_result.primary_destinations:
@@ -1604,28 +2448,28 @@ class DestinationResearchAgent:
             print(f"   🔍 Filtering destinations by feasibility (min score: {min_feasibility_score})...")
             feasible_destinations = []
             infeasible_destinations = []
+            destinations_by_name = {dest.name: dest for dest in initial_result.primary_destinations}
             
             for dest_name, feasibility_result in feasibility_results:
-                print(f"   📊 {dest_name}: Score {feasibility_result.feasibility_score:.2f}, Feasible: {feasibility_result.is_feasible}")
+                logger.debug("%s: score %.2f, feasible: %s", dest_name, feasibility_result.feasibility_score, feasibility_result.is_feasible)
                 if feasibility_result.is_feasible and feasibility_result.feasibility_score >= min_feasibility_score:
                     # Find the original destination object
-                    original_dest = next((d for d in initial_result.primary_destinations if d.name == dest_name), None)
+                    original_dest = destinations_by_name.get(dest_name)
                     if original_dest:
                         # Add feasibility information to the destination
-                        original_dest.estimated_cost = f"${feasibility_result.estimated_total_cost:.0f}"
+                        travel_time = "Unknown"
                         if isinstance(feasibility_result.details, dict):
                             flight_details = feasibility_result.details.get("flight", {})
                             if isinstance(flight_details, dict):
-                                original_dest.travel_time_from_origin = flight_details.get("flight_duration", "Unknown")
-                            else:
-                                original_dest.travel_time_from_origin = "Unknown"
-                        else:
-                            original_dest.travel_time_from_origin = "Unknown"
-                        feasible_destinations.append(original_dest)
-                        print(f"   ✅ {dest_name} added to feasible destinations")
+                                travel_time = flight_details.get("flight_duration", "Unknown")
+                        feasible_destinations.append(original_dest.model_copy(update={
+                            "estimated_cost": f"${feasibility_result.estimated_total_cost:.0f}",
+                            "travel_time_from_origin": travel_time
+                        }))
+                        logger.debug("%s added to feasible destinations", dest_name)
                 else:
                     infeasible_destinations.append((dest_name, feasibility_result))
-                    print(f"   ❌ {dest_name} marked as infeasible")
+                    logger.debug("%s marked as infeasible", dest_name)
             
             print(f"   📈 Results: {len(feasible_destinations)} feasible, {len(infeasible_destinations)} infeasible")
             
@@ -1633,12 +2477,14 @@ class DestinationResearchAgent:
             if feasible_destinations:
                 print(f"✅ Found {len(feasible_destinations)} feasible destinations")
                 
-                # Update the result with feasible destinations
-                initial_result.primary_destinations = feasible_destinations
+                # Update the result with feasible destinations; the rest of the original primaries become
+                # alternatives (feasible ones are updated copies, so match them by name)
+                feasible_names = {dest.name for dest in feasible_destinations}
                 initial_result.alternative_destinations = initial_result.alternative_destinations + [
-                    dest for dest in initial_result.primary_destinations 
-                    if dest not in feasible_destinations
+                    dest for dest in initial_result.primary_destinations
+                    if dest.name not in feasible_names
                 ]
+                initial_result.primary_destinations = feasible_destinations
                 
                 # Add feasibility information to the recommendations
                 feasibility_summary = self._create_feasibility_summary(feasible_destinations, infeasible_destinations)
@@ -1668,37 +2514,36 @@ class DestinationResearchAgent:
     ) -> str:
         """Create a summary of feasibility results"""
         
-        summary = "## Feasibility Analysis\n\n"
+        parts = ["## Feasibility Analysis\n"]
         
         if feasible_destinations:
-            summary += "### ✅ Feasible Destinations:\n"
+            parts.append("### ✅ Feasible Destinations:")
             for dest in feasible_destinations:
-                summary += f"- **{dest.name}**: Estimated cost {dest.estimated_cost}, Travel time {dest.travel_time_from_origin}\n"
+                parts.append(f"- **{dest.name}**: Estimated cost {dest.estimated_cost}, Travel time {dest.travel_time_from_origin}")
         
         if infeasible_destinations:
-            summary += "\n### ⚠️ Destinations with Issues:\n"
+            parts.append("\n### ⚠️ Destinations with Issues:")
             for dest_name, feasibility_result in infeasible_destinations:
-                summary += f"- **{dest_name}**: {', '.join(feasibility_result.issues)}\n"
+                parts.append(f"- **{dest_name}**: {', '.join(feasibility_result.issues)}")
         
-        return summary
+        return "\n".join(parts) + "\n"
     
     def _create_feasibility_warnings(self, infeasible_destinations: List[Tuple[str, Any]]) -> str:
         """Create warnings for infeasible destinations"""
         
-        warnings = "## ⚠️ Feasibility Warnings\n\n"
-        warnings += "The following destinations have feasibility issues:\n\n"
+        parts = ["## ⚠️ Feasibility Warnings\n", "The following destinations have feasibility issues:\n"]
         
         for dest_name, feasibility_result in infeasible_destinations:
-            warnings += f"### {dest_name}\n"
-            warnings += f"- **Feasibility Score**: {feasibility_result.feasibility_score:.1f}/1.0\n"
-            warnings += f"- **Issues**: {', '.join(feasibility_result.issues)}\n"
+            parts.append(f"### {dest_name}")
+            parts.append(f"- **Feasibility Score**: {feasibility_result.feasibility_score:.1f}/1.0")
+            parts.append(f"- **Issues**: {', '.join(feasibility_result.issues)}")
             
             if feasibility_result.alternatives:
-                warnings += f"- **Suggested Alternatives**: {', '.join(feasibility_result.alternatives)}\n"
+                parts.append(f"- **Suggested Alternatives**: {', '.join(feasibility_result.alternatives)}")
             
-            warnings += "\n"
+            parts.append("")
         
-        return warnings
+        return "\n".join(parts) + "\n"
     
     def _generate_alternative_destinations(
         self, 
@@ -1710,13 +2555,17 @@ class DestinationResearchAgent:
         
         print("🔄 Generating alternative destinations...")
         
-        # Collect all alternatives from infeasible destinations
-        all_alternatives = []
+        # Collect the first 5 unique alternatives suggested for the infeasible destinations
+        seen_alternatives = set()
+        unique_alternatives = []
         for _, feasibility_result in infeasible_destinations:
-            all_alternatives.extend(feasibility_result.alternatives)
-        
-        # Remove duplicates and limit to top 5
-        unique_alternatives = list(dict.fromkeys(all_alternatives))[:5]
+            for alternative in feasibility_result.alternatives:
+                if alternative not in seen_alternatives:
+                    seen_alternatives.add(alternative)
+                    unique_alternatives.append(alternative)
+            if len(unique_alternatives) >= 5:
+                break
+        unique_alternatives = unique_alternatives[:5]
         
         if not unique_alternatives:
             return None
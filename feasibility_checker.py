@@ -2,12 +2,14 @@
 Feasibility Checker for validating travel recommendations against real constraints
 """
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from preferences_manager import PreferencesManager
+from preferences_manager import get_preferences_manager
 from real_travel_apis import RealTravelAPIs
 
 # Load environment variables
@@ -29,7 +31,7 @@ class FeasibilityChecker:
     """Checks feasibility of travel recommendations"""
     
     def __init__(self, preferences_file: str = "travel_preferences.json", mock_mode: bool = False):
-        self.preferences_manager = PreferencesManager(preferences_file)
+        self.preferences_manager = get_preferences_manager(preferences_file)
         self.mock_mode = mock_mode
         if not mock_mode:
             self.travel_apis = RealTravelAPIs()
@@ -549,18 +551,25 @@ class FeasibilityChecker:
         print(f"   💰 Budget: {budget or 'Not specified'}")
         print(f"   👥 Traveler type: {traveler_type}")
         
-        results = []
+        if not destinations:
+            return []
         
-        for i, destination in enumerate(destinations, 1):
-            print(f"\n   🔍 [{i}/{len(destinations)}] Checking feasibility for {destination}...")
-            result = self.check_destination_feasibility(
+        def check(destination: str) -> FeasibilityResult:
+            return self.check_destination_feasibility(
                 destination=destination,
                 origin=origin,
                 travel_dates=travel_dates,
                 budget=budget,
                 traveler_type=traveler_type
             )
-            print(f"   📊 {destination}: Score {result.feasibility_score:.2f}, Feasible: {result.is_feasible}")
+        
+        # Each check waits on flight/hotel APIs, so check the destinations concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(destinations))) as executor:
+            checked = list(executor.map(check, destinations))
+        
+        results = []
+        for i, (destination, result) in enumerate(zip(destinations, checked), 1):
+            print(f"   📊 [{i}/{len(destinations)}] {destination}: Score {result.feasibility_score:.2f}, Feasible: {result.is_feasible}")
             if result.issues:
                 print(f"   ⚠️  Issues: {', '.join(result.issues[:2])}")  # Show first 2 issues
             results.append((destination, result))
@@ -634,3 +643,8 @@ class FeasibilityChecker:
             "adjustment_needed": False,
             "message": "Budget is sufficient, but other constraints prevent feasibility"
         }
+
+@functools.lru_cache(maxsize=8)
+def get_feasibility_checker(preferences_file: str = "travel_preferences.json", mock_mode: bool = False) -> FeasibilityChecker:
+    """Return the FeasibilityChecker shared by agents using this preferences file and mode"""
+    return FeasibilityChecker(preferences_file, mock_mode=mock_mode)
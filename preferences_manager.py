@@ -2,6 +2,8 @@
 Travel Preferences Manager for handling user travel preferences and customization
 """
 
+import functools
+import hashlib
 import json
 import os
 from typing import Dict, List, Optional, Any
@@ -41,7 +43,24 @@ class PreferencesManager:
     
     def __init__(self, preferences_file: str = "travel_preferences.json"):
         self.preferences_file = preferences_file
-        self.preferences = self.load_preferences()
+        self._loaded_mtime = self._file_mtime()
+        self._preferences = self.load_preferences()
+    
+    @property
+    def preferences(self) -> TravelPreferences:
+        """Current preferences, reloaded when the preferences file has changed since it was read"""
+        mtime = self._file_mtime()
+        if mtime != self._loaded_mtime:
+            self._loaded_mtime = mtime
+            self._preferences = self.load_preferences()
+        return self._preferences
+    
+    def _file_mtime(self) -> Optional[int]:
+        """Modification time of the preferences file, or None if it doesn't exist"""
+        try:
+            return os.stat(self.preferences_file).st_mtime_ns
+        except OSError:
+            return None
     
     def load_preferences(self) -> TravelPreferences:
         """Load preferences from JSON file"""
@@ -322,6 +341,10 @@ class PreferencesManager:
         ]
         return (origin, destination) in short_international or (destination, origin) in short_international
     
+    def fingerprint(self) -> str:
+        """Return a short hash of the current preferences, for keying results that depend on them"""
+        return hashlib.blake2b(self.preferences.model_dump_json().encode(), digest_size=16).hexdigest()
+    
     def get_preferences_summary(self) -> str:
         """Get a summary of current preferences"""
         prefs = self.preferences
@@ -606,3 +629,7 @@ Activities:
             return value.model_dump()
         return {}
 
+@functools.lru_cache(maxsize=8)
+def get_preferences_manager(preferences_file: str = "travel_preferences.json") -> PreferencesManager:
+    """Return the PreferencesManager shared by everything using this preferences file"""
+    return PreferencesManager(preferences_file)
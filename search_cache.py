@@ -0,0 +1,150 @@
+"""
+Cache for web search results shared by all agents in the process
+"""
+
+import orjson
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class SearchCache:
+    """Thread-safe LRU cache of web search results keyed by (query, num_results)
+
+    Entries expire after ttl seconds. When a path is given, results are also persisted to a
+    SQLite file so they survive restarts; without one the cache is in-memory only.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None, ttl: float = 24 * 60 * 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, List[str]]]" = OrderedDict()
+        self._pending: Dict[Tuple[str, int], Future] = {}
+        self._lock = threading.Lock()
+        self._db = self._open_db(path) if path else None
+
+    def _open_db(self, path: str) -> Optional[sqlite3.Connection]:
+        """Open the persistent tier, dropping expired rows; fall back to memory only if it can't be opened"""
+        try:
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "query TEXT NOT NULL, num_results INTEGER NOT NULL, results BLOB NOT NULL, stored_at REAL NOT NULL, "
+                "PRIMARY KEY (query, num_results))"
+            )
+            db.execute("DELETE FROM search_results WHERE stored_at < ?", (time.time() - self.ttl,))
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            print(f"⚠️ Search cache file unavailable, caching in memory only: {e}")
+            return None
+
+    def _lookup(self, key: Tuple[str, int]) -> Optional[List[str]]:
+        """Return fresh results for a key from memory, then disk (caller holds the lock)"""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, results = entry
+            if now - stored_at < self.ttl:
+                self._entries.move_to_end(key)
+                return results
+            del self._entries[key]
+
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT results, stored_at FROM search_results WHERE query = ? AND num_results = ?", key
+        ).fetchone()
+        if row is None or now - row[1] >= self.ttl:
+            return None
+        results = orjson.loads(row[0])
+        self._store_in_memory(key, results, row[1])
+        return results
+
+    def _store_in_memory(self, key: Tuple[str, int], results: List[str], stored_at: float) -> None:
+        """Add an entry to the in-memory LRU, evicting the least recently used (caller holds the lock)"""
+        self._entries[key] = (stored_at, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, query: str, num_results: int) -> Optional[List[str]]:
+        """Return cached results for a query, or None on a miss"""
+        with self._lock:
+            results = self._lookup((query, num_results))
+            # Hand out a copy so callers can't mutate the cached list
+            return list(results) if results is not None else None
+
+    def set(self, query: str, num_results: int, results: List[str]) -> None:
+        """Store results for a query, evicting the least recently used entries"""
+        key = (query, num_results)
+        stored_at = time.time()
+        with self._lock:
+            self._store_in_memory(key, list(results), stored_at)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO search_results (query, num_results, results, stored_at) VALUES (?, ?, ?, ?)",
+                        (query, num_results, orjson.dumps(results), stored_at)
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    # Locked, read-only or full cache file - the results are still cached in memory
+                    print(f"⚠️ Could not persist search results, keeping them in memory only: {e}")
+
+    def get_or_fetch(
+        self,
+        query: str,
+        num_results: int,
+        fetch: Callable[[], List[str]],
+        force_refresh: bool = False
+    ) -> List[str]:
+        """Return cached results, or fetch them once even if several threads ask at the same time
+
+        force_refresh skips cached results (e.g. for travel advisories) and stores the fresh ones.
+        """
+        key = (query, num_results)
+        with self._lock:
+            results = None if force_refresh else self._lookup(key)
+            if results is not None:
+                return list(results)
+            pending = self._pending.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                self._pending[key] = pending
+
+        if not is_owner:
+            # Another thread is already fetching this query - share its result (or its error)
+            return list(pending.result())
+
+        try:
+            results = fetch()
+            self.set(query, num_results, results)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(results)
+        finally:
+            # Always release the key, so waiters and later calls never block on an abandoned fetch
+            with self._lock:
+                del self._pending[key]
+        return list(results)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_results")
+                self._db.commit()
+
+# Global instance; results are only persisted when SEARCH_CACHE_PATH names a cache file
+search_cache = SearchCache(path=os.getenv("SEARCH_CACHE_PATH") or None)
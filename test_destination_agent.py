@@ -2,9 +2,13 @@
 Test script for the Destination Research Agent
 """
 
+import json
 import os
+import shutil
+import tempfile
 from dotenv import load_dotenv
-from destination_agent import DestinationResearchAgent
+from destination_agent import DestinationResearchAgent, DestinationRequest, iter_json_array_objects, search_cache_key
+from feasibility_checker import FeasibilityResult
 
 # Load environment variables
 load_dotenv()
@@ -100,6 +104,283 @@ def test_request_analysis():
         print(f"Type: {request_type}")
         print("-" * 40)
 
+def test_quick_request_classification():
+    """Test that unambiguous requests are classified without an LLM call"""
+    # Mock mode has no LLM, so any request that misses the quick classifiers would fail here
+    agent = DestinationResearchAgent(mock_mode=True)
+    
+    print("\n⚡ Testing Quick Request Classification")
+    print("=" * 40)
+    
+    expected_types = {
+        "I want to go to Paris": "specific",
+        "Should I visit Tokyo or Seoul?": "multi_location",
+        "Tokyo vs Seoul travel comparison": "multi_location",
+        "Need a mountain getaway within 2 hours of Denver": "constrained",
+        "Weekend trip, 3 hour drive from Chicago": "constrained",
+        "paris": "specific",
+        "Fly from London to Zürich in May": "specific",
+        "Tokyo and Kyoto in spring": "multi_location",
+        "I want to visit Paris and London": "multi_location",
+        "We want to go to Tokyo and Kyoto in spring": "multi_location",
+        "Fly New York to Paris": "specific",
+        "NYC to London next week": "specific",
+        "Boston → Lisbon in June": "specific",
+        "New York to Paris and Rome": "multi_location"
+    }
+    
+    for request, expected_type in expected_types.items():
+        request_type = agent.analyze_request_type(request)
+        print(f"Request: {request} -> {request_type}")
+        assert request_type == expected_type, f"Expected {expected_type} for '{request}', got {request_type}"
+    
+    # Regions and unknown places aren't guessed at - they go to the LLM
+    for request in ["I want to travel to Europe this summer", "Going to Sedona for the weekend"]:
+        assert agent._classify_without_llm(request) is None, f"'{request}' should be left to the LLM"
+        print(f"Request: {request} -> LLM")
+
+def test_research_batch():
+    """Test researching several requests concurrently"""
+    agent = DestinationResearchAgent(mock_mode=True)
+    
+    print("\n📦 Testing Batch Research")
+    print("=" * 40)
+    
+    requests = [
+        "Beach vacation in Hawaii",
+        "Mountain getaway near Denver",
+        "Cultural trip to Kyoto"
+    ]
+    
+    results = agent.research_destination_batch(requests, max_concurrency=2)
+    
+    assert len(results) == len(requests), f"Expected {len(requests)} results, got {len(results)}"
+    for request, result in zip(requests, results):
+        print(f"Request: {request} -> {len(result.primary_destinations)} destinations")
+        assert result.primary_destinations, f"No destinations for '{request}'"
+    assert agent.research_destination_batch([]) == []
+
+def test_research_result_cache():
+    """Test that finished research is reused only for identical requests and preferences"""
+    prefs_dir = tempfile.mkdtemp()
+    prefs_path = os.path.join(prefs_dir, "travel_preferences.json")
+    with open(prefs_path, "w") as f:
+        json.dump({"traveler_profile": {"home_airport": "SFO"}}, f)
+    agent = DestinationResearchAgent(preferences_file=prefs_path, mock_mode=True)
+    
+    print("\n♻️ Testing Research Result Cache")
+    print("=" * 40)
+    
+    request = DestinationRequest(query="Beach vacation in Hawaii", origin_location="SFO", travel_dates="June", budget="$3000")
+    result = agent._mock_research_destination("Beach vacation in Hawaii")
+    key = agent._result_cache_key("abstract", request)
+    
+    assert agent._get_cached_result(key) is None
+    agent._store_result(key, result)
+    cached = agent._get_cached_result(key)
+    assert cached == result and cached is not result
+    print("✅ Identical request reuses the stored result")
+    
+    other_request = request.model_copy(update={"budget": "$5000"})
+    assert agent._result_cache_key("abstract", other_request) != key
+    assert agent._result_cache_key("specific", request) != key
+    print("✅ Different parameters or request type miss the cache")
+    
+    # Saving new preferences (e.g. from the web UI) changes the key without restarting
+    with open(prefs_path, "w") as f:
+        json.dump({"traveler_profile": {"home_airport": "JFK"}}, f)
+    stat = os.stat(prefs_path)
+    os.utime(prefs_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert agent._result_cache_key("abstract", request) != key
+    print("✅ Changed preferences miss the cache")
+    shutil.rmtree(prefs_dir)
+
+def test_origin_from_home_airport():
+    """Test that a request without an origin uses the home airport from preferences"""
+    prefs_dir = tempfile.mkdtemp()
+    prefs_path = os.path.join(prefs_dir, "travel_preferences.json")
+    with open(prefs_path, "w") as f:
+        json.dump({"traveler_profile": {"home_airport": "SFO"}}, f)
+    agent = DestinationResearchAgent(preferences_file=prefs_path, mock_mode=True)
+    
+    print("\n🛫 Testing Origin Validation")
+    print("=" * 40)
+    
+    request = DestinationRequest(query="Beach vacation in Hawaii", origin_location="Not specified")
+    assert agent._validate_origin(request) is None
+    assert request.origin_location == "SFO"
+    print("✅ Missing origin filled in from the home airport")
+    
+    request = DestinationRequest(query="Beach vacation in Hawaii", origin_location="JFK")
+    assert agent._validate_origin(request) is None
+    assert request.origin_location == "JFK"
+    print("✅ Requested origin kept")
+    
+    no_home_path = os.path.join(prefs_dir, "no_home_airport.json")
+    with open(no_home_path, "w") as f:
+        json.dump({"traveler_profile": {}}, f)
+    agent = DestinationResearchAgent(preferences_file=no_home_path, mock_mode=True)
+    assert "Origin location is required" in agent._validate_origin(DestinationRequest(query="Beach vacation in Hawaii"))
+    print("✅ Origin still required without a home airport")
+    shutil.rmtree(prefs_dir)
+
+def test_infeasible_destinations_become_alternatives():
+    """Test that primaries failing the feasibility check are kept as alternatives"""
+    agent = DestinationResearchAgent(mock_mode=True)
+    
+    print("\n🧭 Testing Feasibility Filtering")
+    print("=" * 40)
+    
+    class FirstDestinationFeasible:
+        def check_multiple_destinations(self, destinations, **kwargs):
+            return [
+                (name, FeasibilityResult(
+                    is_feasible=(i == 0), feasibility_score=0.9 if i == 0 else 0.2, issues=[], alternatives=[],
+                    estimated_total_cost=1200.0, details={"flight": {"flight_duration": "1h 30m"}}
+                ))
+                for i, name in enumerate(destinations)
+            ]
+    
+    # Replace the checker on this agent only - the default one is shared by every agent
+    agent.feasibility_checker = FirstDestinationFeasible()
+    researched = agent.research_destination("Beach vacation in Hawaii")
+    result = agent.research_destination_with_feasibility("Beach vacation in Hawaii")
+    
+    assert [dest.name for dest in result.primary_destinations] == [researched.primary_destinations[0].name]
+    assert result.primary_destinations[0].estimated_cost == "$1200"
+    assert [dest.name for dest in result.alternative_destinations][-2:] == [
+        dest.name for dest in researched.primary_destinations[1:]
+    ]
+    print(f"✅ {len(result.primary_destinations)} feasible, {len(result.alternative_destinations)} alternatives")
+
+def test_streamed_destination_parsing():
+    """Test that objects in a streamed JSON array are yielded as soon as each one is complete"""
+    print("\n📡 Testing Streamed Destination Parsing")
+    print("=" * 40)
+    
+    reply = '```json\n[{"name": "Big Sur", "note": "cliffs {and} \\"coves\\""}, {"name": "Napa", "tags": ["wine", "]"]}]\n```'
+    chunks = [reply[i:i + 7] for i in range(0, len(reply), 7)]
+    chunks_read = []
+    
+    def stream():
+        for chunk in chunks:
+            chunks_read.append(chunk)
+            yield chunk
+    
+    objects = iter_json_array_objects(stream())
+    first = next(objects)
+    assert json.loads(first) == {"name": "Big Sur", "note": 'cliffs {and} "coves"'}
+    assert len(chunks_read) < len(chunks)
+    print("✅ First destination available before the rest of the reply is read")
+    
+    assert [json.loads(obj)["name"] for obj in objects] == ["Napa"]
+    assert list(iter_json_array_objects(['{"destinations": [{"name": "Kyoto"}]}'])) == ['{"name": "Kyoto"}']
+    assert list(iter_json_array_objects(["No destinations found"])) == []
+    print("✅ Fences, wrapping objects and brackets inside strings are handled")
+
+def test_deterministic_destination_extraction():
+    """Test that labeled research text is structured without an extraction call"""
+    print("\n🏷️ Testing Deterministic Destination Extraction")
+    print("=" * 40)
+    
+    agent = DestinationResearchAgent(mock_mode=True)
+    response = """# Kyoto Travel Guide
+
+Kyoto is Japan's former imperial capital, known for temples, gardens and geisha districts.
+
+- **Country:** Japan
+- **Region**: Kansai
+- **Best Time to Visit**: March-May and October-November
+- **Language:** Japanese
+- **Currency**: Japanese Yen (JPY)
+- Climate: Humid subtropical with hot summers
+
+### Key Attractions
+1. **Fushimi Inari Shrine**: thousands of torii gates
+2. Arashiyama Bamboo Grove
+
+### Activities
+- Tea ceremony
+"""
+    destination = agent._create_destination_from_llm_response(response, "Kyoto")
+    assert destination.country == "Japan"
+    assert destination.best_time_to_visit == "March-May and October-November"
+    assert destination.currency == "Japanese Yen (JPY)"
+    assert destination.key_attractions == ["Fushimi Inari Shrine", "Arashiyama Bamboo Grove"]
+    assert destination.activities == ["Tea ceremony"]
+    assert destination.description.startswith("Kyoto is Japan's former imperial capital")
+    print("✅ Labeled fields and bullet lists filled in locally")
+    
+    assert agent._try_deterministic_extract("Kyoto is lovely. Currency: Yen", "Kyoto") is None
+    print("✅ Sparse text is left to the LLM")
+
+def test_destination_name_matching():
+    """Test that destination names are read from search result titles without an LLM call"""
+    print("\n🔤 Testing Destination Name Matching")
+    print("=" * 40)
+    
+    agent = DestinationResearchAgent(mock_mode=True)
+    
+    def name_for(title):
+        return agent._match_destination_name(f"Title: {title}\nSnippet: Ideas for your trip\nSource: https://example.com")
+    
+    assert name_for("Paris Travel Guide - Lonely Planet") == "Paris"
+    assert name_for("Explore Zürich's old town") == "Zurich"
+    assert name_for("Top 10 Things To Do In Monterey, California") == "Monterey"
+    assert name_for("Visit Carmel-by-the-Sea, CA") == "Carmel-by-the-Sea"
+    print("✅ Known destinations and \"City, ST\" titles matched")
+    
+    assert name_for("Weekend Getaways From San Francisco, CA") is None
+    assert name_for("15 best beach towns near Los Angeles") is None
+    assert name_for("Weekend trips from Seattle, WA to Portland, OR") == "Portland"
+    print("✅ Origins after \"from\"/\"near\" are not taken as destinations")
+
+def test_travel_time_parsing():
+    """Test that travel time constraints are read in hours whatever unit they use"""
+    print("\n⏱️ Testing Travel Time Parsing")
+    print("=" * 40)
+    
+    agent = DestinationResearchAgent(mock_mode=True)
+    cases = {
+        "3 hours": 3, "3-hour": 3, "3h": 3, "5hrs": 5, "4": 4, "2.5 hours": 2.5,
+        "90 minutes": 1.5, "30 min": 0.5, "2 days": 48, "no limit": None
+    }
+    for travel_time, expected in cases.items():
+        assert agent._parse_hours(travel_time) == expected, f"{travel_time!r} -> {agent._parse_hours(travel_time)}"
+    print(f"✅ Parsed {len(cases)} travel time formats")
+
+def test_search_operators_kept():
+    """Test that search queries keep Google's uppercase operators while sharing case-insensitive cache entries"""
+    print("\n🔎 Testing Search Query Operators")
+    print("=" * 40)
+    
+    agent = DestinationResearchAgent(mock_mode=True)
+    agent.serpapi_key = "test-key"
+    sent_queries = []
+    
+    def fetch(query, num_results):
+        sent_queries.append(query)
+        return [f"Title: {query}"]
+    
+    agent._fetch_search_results = fetch
+    query = "Lisbon  travel guide (best time to visit OR visa requirements)"
+    agent.search_web(query, num_results=2, force_refresh=True)
+    assert sent_queries == ["Lisbon travel guide (best time to visit OR visa requirements)"], sent_queries
+    print("✅ OR operator sent unchanged")
+    
+    # Differently cased words share the cached results, but a lowercase "or" is a different search
+    assert agent.search_web("lisbon TRAVEL guide (best time to visit OR visa requirements)", num_results=2)
+    assert len(sent_queries) == 1
+    agent.search_web("lisbon travel guide (best time to visit or visa requirements)", num_results=2, force_refresh=True)
+    assert sent_queries[-1].endswith("visit or visa requirements)")
+    assert search_cache_key(sent_queries[0]) != search_cache_key(sent_queries[-1])
+    print("✅ Cache keys ignore word case but not operators")
+    
+    # Each travel info topic is a quoted phrase, so OR picks between whole topics
+    agent.get_current_travel_info("Lisbon")
+    assert '("best time to visit" OR "visa requirements" OR "travel advisory")' in sent_queries[-1], sent_queries[-1]
+    print("✅ Travel info topics sent as quoted OR alternatives")
+
 def test_web_search():
     """Test web search functionality"""
     agent = DestinationResearchAgent()
@@ -127,4 +408,14 @@ def test_web_search():
 if __name__ == "__main__":
     test_destination_agent()
     test_request_analysis()
+    test_quick_request_classification()
+    test_research_batch()
+    test_research_result_cache()
+    test_origin_from_home_airport()
+    test_infeasible_destinations_become_alternatives()
+    test_streamed_destination_parsing()
+    test_deterministic_destination_extraction()
+    test_destination_name_matching()
+    test_travel_time_parsing()
+    test_search_operators_kept()
     test_web_search()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test script for the web search result cache
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from search_cache import SearchCache
+
+def test_search_cache():
+    """Test that search results are cached per (query, num_results) with LRU eviction"""
+    print("🧪 Testing Search Cache")
+    print("=" * 50)
+
+    cache = SearchCache(maxsize=2)
+
+    # Misses return None so callers can tell them apart from cached empty results
+    assert cache.get("paris travel guide", 2) is None
+
+    cache.set("paris travel guide", 2, ["Title: Paris\nSnippet: Guide\nSource: example.com"])
+    cache.set("tokyo travel guide", 2, [])
+    print("   ✅ Stored two queries")
+
+    assert cache.get("paris travel guide", 2) == ["Title: Paris\nSnippet: Guide\nSource: example.com"]
+    assert cache.get("tokyo travel guide", 2) == []
+    assert cache.get("paris travel guide", 5) is None, "num_results is part of the cache key"
+    print("   ✅ Cache hits return stored results")
+
+    # Returned lists are copies
+    cache.get("paris travel guide", 2).append("mutated")
+    assert len(cache.get("paris travel guide", 2)) == 1
+    print("   ✅ Cached results can't be mutated by callers")
+
+    # Paris was used most recently, so Tokyo is evicted
+    cache.set("rome travel guide", 2, ["Title: Rome"])
+    assert cache.get("tokyo travel guide", 2) is None
+    assert cache.get("paris travel guide", 2) is not None
+    assert cache.get("rome travel guide", 2) == ["Title: Rome"]
+    print("   ✅ Least recently used entry evicted")
+
+    cache.clear()
+    assert cache.get("rome travel guide", 2) is None
+    print("   ✅ Cache cleared")
+
+    print("\n🎉 Search cache test completed!")
+
+def test_concurrent_identical_queries():
+    """Test that concurrent identical queries share one fetch"""
+    print("🧪 Testing In-Flight Query Deduplication")
+    print("=" * 50)
+
+    cache = SearchCache()
+    fetch_count = 0
+
+    def fetch():
+        nonlocal fetch_count
+        fetch_count += 1
+        time.sleep(0.1)  # Simulate SerpAPI latency so the other threads arrive mid-request
+        return ["Title: Lisbon"]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("lisbon travel guide", 2, fetch)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetch_count == 1, f"Expected a single fetch, got {fetch_count}"
+    assert results == [["Title: Lisbon"]] * 4
+    print("   ✅ Four concurrent lookups issued one request")
+
+    # Failed fetches are not cached, so the next call retries
+    def failing_fetch():
+        raise ConnectionError("SerpAPI unavailable")
+
+    try:
+        cache.get_or_fetch("madrid travel guide", 2, failing_fetch)
+        assert False, "Expected the fetch error to propagate"
+    except ConnectionError:
+        pass
+    assert cache.get_or_fetch("madrid travel guide", 2, lambda: ["Title: Madrid"]) == ["Title: Madrid"]
+    print("   ✅ Failed fetches are retried")
+
+    print("\n🎉 In-flight deduplication test completed!")
+
+def test_persistent_cache():
+    """Test that results survive a restart, expire after the TTL and can be force-refreshed"""
+    print("🧪 Testing Persistent Search Cache")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "search_cache.sqlite3")
+
+        SearchCache(path=path).set("kyoto travel guide", 2, ["Title: Kyoto"])
+        restarted = SearchCache(path=path)
+        assert restarted.get("kyoto travel guide", 2) == ["Title: Kyoto"]
+        print("   ✅ Results survive a restart")
+
+        fetch_count = 0
+
+        def fetch():
+            nonlocal fetch_count
+            fetch_count += 1
+            return [f"Title: Kyoto advisory {fetch_count}"]
+
+        assert restarted.get_or_fetch("kyoto travel guide", 2, fetch) == ["Title: Kyoto"]
+        assert fetch_count == 0
+        assert restarted.get_or_fetch("kyoto travel guide", 2, fetch, force_refresh=True) == ["Title: Kyoto advisory 1"]
+        assert SearchCache(path=path).get("kyoto travel guide", 2) == ["Title: Kyoto advisory 1"]
+        print("   ✅ force_refresh fetches and stores fresh results")
+
+        expiring = SearchCache(path=path, ttl=0.05)
+        time.sleep(0.1)
+        assert expiring.get("kyoto travel guide", 2) is None
+        print("   ✅ Expired results are not served")
+
+    print("\n🎉 Persistent search cache test completed!")
+
+def test_failed_disk_write():
+    """Test that a failing cache file neither loses results nor blocks threads waiting on the fetch"""
+    print("🧪 Testing Failed Search Cache Writes")
+    print("=" * 50)
+
+    class ReadOnlyDb:
+        """Wraps a connection so every INSERT fails like a locked or read-only file"""
+        def __init__(self, db):
+            self.db = db
+
+        def execute(self, sql, params=()):
+            if sql.startswith("INSERT"):
+                raise sqlite3.OperationalError("attempt to write a readonly database")
+            return self.db.execute(sql, params)
+
+        def commit(self):
+            self.db.commit()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SearchCache(path=os.path.join(cache_dir, "search_cache.sqlite3"))
+        cache._db = ReadOnlyDb(cache._db)
+        fetch_started = threading.Event()
+
+        def fetch():
+            fetch_started.set()
+            time.sleep(0.1)  # Keep the fetch in flight until the waiter has joined it
+            return ["Title: Porto"]
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get_or_fetch("porto travel guide", 2, fetch)), daemon=True)
+        owner.start()
+        fetch_started.wait()
+        waiter = threading.Thread(target=lambda: results.append(cache.get_or_fetch("porto travel guide", 2, fetch)), daemon=True)
+        waiter.start()
+        owner.join(timeout=5)
+        waiter.join(timeout=5)
+
+        assert not owner.is_alive() and not waiter.is_alive(), "A thread blocked on the failed write"
+        assert results == [["Title: Porto"]] * 2
+        assert not cache._pending
+        print("   ✅ Owner and waiter both got results")
+
+        assert cache.get("porto travel guide", 2) == ["Title: Porto"]
+        assert cache.get_or_fetch("porto travel guide", 2, lambda: ["Title: Porto 2"], force_refresh=True) == ["Title: Porto 2"]
+        print("   ✅ Results kept in memory and the key can be fetched again")
+
+    print("\n🎉 Failed write test completed!")
+
+if __name__ == "__main__":
+    test_search_cache()
+    test_concurrent_identical_queries()
+    test_persistent_cache()
+    test_failed_disk_write()
@@ -0,0 +1,34 @@
+import json
+import os
+
+from feasibility_checker import get_feasibility_checker
+from preferences_manager import get_preferences_manager
+
+
+def test_preferences_shared_per_file(tmp_path):
+    prefs_path = str(tmp_path / "prefs.json")
+    other_path = str(tmp_path / "other.json")
+
+    manager = get_preferences_manager(prefs_path)
+
+    assert get_preferences_manager(prefs_path) is manager
+    assert get_preferences_manager(other_path) is not manager
+    assert get_feasibility_checker(prefs_path, mock_mode=True).preferences_manager is manager
+    assert get_feasibility_checker(prefs_path, mock_mode=True) is get_feasibility_checker(prefs_path, mock_mode=True)
+
+
+def test_preferences_reload_when_file_changes(tmp_path):
+    prefs_path = tmp_path / "prefs.json"
+    prefs_path.write_text(json.dumps({"traveler_profile": {"home_airport": "SFO"}}))
+
+    manager = get_preferences_manager(str(prefs_path))
+    assert manager.preferences.traveler_profile["home_airport"] == "SFO"
+    fingerprint = manager.fingerprint()
+
+    prefs_path.write_text(json.dumps({"traveler_profile": {"home_airport": "JFK"}}))
+    # Make sure the change is visible even on filesystems with coarse timestamps
+    stat = os.stat(prefs_path)
+    os.utime(prefs_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert manager.preferences.traveler_profile["home_airport"] == "JFK"
+    assert manager.fingerprint() != fingerprint
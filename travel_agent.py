@@ -4,8 +4,11 @@ LangGraph Travel Agent for creating trip itineraries
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from typing import Dict, List, TypedDict, Annotated, Optional
 from dotenv import load_dotenv
+from openai import OpenAIError
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import tool
@@ -13,7 +16,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from pydantic import BaseModel
 from real_travel_apis import search_flights_real_api, search_hotels_real_api
-from destination_agent import DestinationResearchAgent, DestinationResearchResult
+from destination_agent import DestinationResearchAgent, DestinationResearchResult, SERPAPI_TIMEOUT, parse_llm_json
 
 # Load environment variables
 load_dotenv()
@@ -62,6 +65,13 @@ class TravelAgent:
         self.mock_mode = mock_mode
         self.llm = ChatOpenAI(model=model_name, temperature=0.7)
         self.destination_agent = DestinationResearchAgent(model_name, mock_mode=mock_mode)
+        # Keep-alive session so repeated SerpAPI airport lookups reuse pooled TCP/TLS connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
         self.tools = self._create_tools()
         self.graph = self._build_graph()
     
@@ -155,17 +165,8 @@ class TravelAgent:
         try:
             response = self.llm.invoke([HumanMessage(content=prompt)])
             
-            # Parse the JSON response
-            import json
-            import re
-            
-            # Extract JSON from the response (handle cases where LLM adds extra text)
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                parsed_data = json.loads(json_match.group())
-            else:
-                # Fallback: try to parse the entire response as JSON
-                parsed_data = json.loads(response.content)
+            # Parse the JSON response (handles cases where LLM adds extra text)
+            parsed_data = parse_llm_json(response.content)
             
             # Create TripSpecification with parsed data
             trip_spec = TripSpecification(
@@ -190,7 +191,8 @@ class TravelAgent:
             print(f"      📅 Travel Dates: {trip_spec.travel_dates}")
             print(f"      ✈️ Origin: {trip_spec.origin}")
             
-        except (json.JSONDecodeError, KeyError, Exception) as e:
+        except (OpenAIError, ValueError, AttributeError) as e:
+            # API errors, malformed JSON or fields TripSpecification rejects, or a reply that isn't a JSON object
             print(f"   ⚠️  LLM parsing failed, using fallback: {e}")
             # Fallback to a simple default
             trip_spec = TripSpecification(
@@ -228,7 +230,7 @@ class TravelAgent:
                 'num': 5
             }
             
-            response = requests.get('https://serpapi.com/search', params=params)
+            response = self._session.get('https://serpapi.com/search', params=params, timeout=SERPAPI_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 organic_results = data.get('organic_results', [])
@@ -282,18 +284,13 @@ class TravelAgent:
             response = self.llm.invoke([HumanMessage(content=prompt)])
             
             # Parse the JSON response
-            import json
-            import re
-            
-            # Extract JSON from the response
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                airports = json.loads(json_match.group())
-                print(f"   🧠 LLM found airports: {airports}")
-                return airports
-            else:
+            try:
+                airports = parse_llm_json(response.content)
+            except ValueError:
                 print(f"   ⚠️  Could not parse LLM response")
                 return {"primary": "UNKNOWN", "alternatives": []}
+            print(f"   🧠 LLM found airports: {airports}")
+            return airports
                 
         except Exception as e:
             print(f"   ❌ Error in LLM airport lookup: {e}")